@@ -136,7 +136,10 @@ def main():
             logger.info(f"  ✅ Ad detection: {ad_result.get('articles_passed', 0)} articles passed")
             
             logger.info("  🤖 Running LLM quality scoring...")
-            llm_result = llm_scorer.execute()
+            try:
+                llm_result = llm_scorer.execute()
+            finally:
+                llm_scorer.close()
             if not llm_result['success']:
                 logger.error(f"  ❌ LLM quality scoring failed: {llm_result.get('error')}")
                 return 1
@@ -157,7 +160,10 @@ def main():
             logger.info(f"  ✅ Article prioritization: {priority_result.get('articles_prioritized', 0)} articles prioritized")
             
             logger.info("  📝 Running summarization...")
-            summary_result = summarizer.execute()
+            try:
+                summary_result = summarizer.execute()
+            finally:
+                summarizer.close()
             if not summary_result['success']:
                 logger.error(f"  ❌ Summarization failed: {summary_result.get('error')}")
                 return 1
@@ -174,7 +180,10 @@ def main():
         if args.step == 'all':
             logger.info("🐙 Running GitHub trending processing...")
             github_processor = GitHubTrendingProcessor(config_loader)
-            github_result = github_processor.process()
+            try:
+                github_result = github_processor.process()
+            finally:
+                github_processor.close()
             if not github_result['success']:
                 logger.error(f"❌ GitHub trending processing failed: {github_result.get('error')}")
                 return 1
@@ -202,7 +211,10 @@ def main():
         elif args.step == 'llm_quality_scoring':
             logger.info("🤖 Running LLM quality scoring step only")
             llm_scorer = LLMQualityScoringStep(config_loader)
-            llm_result = llm_scorer.execute()
+            try:
+                llm_result = llm_scorer.execute()
+            finally:
+                llm_scorer.close()
             if not llm_result['success']:
                 logger.error(f"❌ LLM quality scoring failed: {llm_result.get('error')}")
                 return 1
@@ -229,7 +241,10 @@ def main():
         elif args.step == 'summarization':
             logger.info("📝 Running summarization step only")
             summarizer = SummarizationStep(config_loader)
-            summary_result = summarizer.execute()
+            try:
+                summary_result = summarizer.execute()
+            finally:
+                summarizer.close()
             if not summary_result['success']:
                 logger.error(f"❌ Summarization failed: {summary_result.get('error')}")
                 return 1
@@ -247,7 +262,10 @@ def main():
         elif args.step == 'github_trending_processing':
             logger.info("🐙 Running GitHub trending processing step only")
             github_processor = GitHubTrendingProcessor(config_loader)
-            github_result = github_processor.process()
+            try:
+                github_result = github_processor.process()
+            finally:
+                github_processor.close()
             if not github_result['success']:
                 logger.error(f"❌ GitHub trending processing failed: {github_result.get('error')}")
                 return 1
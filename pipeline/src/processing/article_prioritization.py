@@ -8,7 +8,9 @@ and optional (remaining articles) based on impact and relevance.
 
 import json
 import time
+import hashlib
 import logging
+import threading
 import os
 import re
 from pathlib import Path
@@ -57,6 +59,11 @@ class ArticlePrioritizationStep:
             # Fallback to Ollama configuration
             self.ollama_endpoint = self.llm_config['ollama']['server_url']
             self.model_name = self.llm_config['ollama']['model']
+            self.keep_alive = self.llm_config['ollama'].get('keep_alive', '24h')
+            
+            # Warm the model in the background so execute() doesn't pay the cold load
+            if self.llm_config.get('preload', False):
+                threading.Thread(target=self._preload_ollama_model, daemon=True).start()
         
         # Prioritization configuration
         self.prioritization_config = self.config['prioritization']
@@ -67,6 +74,20 @@ class ArticlePrioritizationStep:
         # Impact criteria
         self.impact_criteria = self.prioritization_config['impact_criteria']
         
+    def _preload_ollama_model(self) -> None:
+        """Load the Ollama model into memory and keep it resident for the run."""
+        try:
+            import requests
+            
+            requests.post(
+                f"{self.ollama_endpoint}/api/generate",
+                json={"model": self.model_name, "prompt": "", "keep_alive": self.keep_alive},
+                timeout=120
+            )
+            self.logger.debug(f"Preloaded Ollama model {self.model_name}")
+        except Exception as e:
+            self.logger.warning(f"Ollama model preload failed: {e}")
+    
     def _load_input_data(self) -> List[Dict[str, Any]]:
         """Load input data from deduplication step."""
         import glob
@@ -329,6 +350,40 @@ Return only the JSON response, no additional text."""
         
         return prompt
     
+    def _get_cache_path(self, prompt: str) -> Path:
+        """
+        Build the LLM result cache path.
+        
+        The LLM response refers to articles by their 1-based position, so the key hashes
+        the full prompt (ordered articles and their previews) together with the provider,
+        model and category targets.
+        """
+        key = f"{self.provider}|{self.model_name}|{self.headlines_count}|{self.secondary_count}|{prompt}"
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+        return Path(self.data_paths['processed']) / f".priocache_{digest}.json"
+    
+    def _load_cached_response(self, cache_path: Path) -> Optional[Dict[str, Any]]:
+        """Load a cached LLM categorization response if one exists."""
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached_response = json.load(f)
+            self.logger.info(f"♻️  Using cached LLM categorization: {cache_path.name}")
+            return cached_response
+        except Exception as e:
+            self.logger.warning(f"Failed to read prioritization cache {cache_path}: {e}")
+            return None
+    
+    def _save_cached_response(self, cache_path: Path, llm_response: Dict[str, Any]) -> None:
+        """Persist a successful LLM categorization response for identical re-runs."""
+        try:
+            with open(cache_path, 'w', encoding='utf-8') as f:
+                json.dump(llm_response, f, ensure_ascii=False)
+        except Exception as e:
+            self.logger.warning(f"Failed to write prioritization cache {cache_path}: {e}")
+    
     def _call_llm(self, prompt: str) -> Dict[str, Any]:
         """Call LLM for article prioritization with fallback support."""
         try:
@@ -347,6 +402,7 @@ Return only the JSON response, no additional text."""
                     "model": self.model_name,
                     "prompt": prompt,
                     "stream": False,
+                    "keep_alive": self.keep_alive,
                     "options": {
                         "temperature": 0.3,  # Lower temperature for more consistent results
                         "top_p": 0.9,
@@ -539,8 +595,16 @@ Return only the JSON response, no additional text."""
             # Create prioritization prompt
             prompt = self._create_prioritization_prompt(articles)
             
-            # Call LLM for prioritization
-            llm_response = self._call_llm(prompt)
+            # Reuse a cached LLM response for an identical prompt and model
+            cache_path = self._get_cache_path(prompt)
+            llm_response = self._load_cached_response(cache_path)
+            
+            if llm_response is None:
+                # Call LLM for prioritization
+                llm_response = self._call_llm(prompt)
+                
+                if llm_response is not None:
+                    self._save_cached_response(cache_path, llm_response)
             
             # Categorize articles based on LLM response or fallback
             if llm_response is not None:
@@ -5,14 +5,15 @@ This step uses sentence transformers to find similar articles and selects
 the highest quality one from each group of similar articles.
 """
 
-import json
 import time
+import hashlib
 import logging
 import os
 import re
 from pathlib import Path
 from datetime import datetime
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 
 import sys
@@ -20,17 +21,31 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logger import get_logger
-from src.utils.config_loader import ConfigLoader
+from src.utils.config_loader import ConfigLoader, resolve_pipeline_path
+from src.utils.json_utils import load_json, dump_json
 
 # For embeddings and similarity
 try:
+    import torch
     from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
     import numpy as np
     SENTENCE_TRANSFORMERS_AVAILABLE = True
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+# Optional approximate nearest-neighbour search for large inputs
+try:
+    import faiss
+    FAISS_AVAILABLE = True
+except ImportError:
+    FAISS_AVAILABLE = False
+
+# Precompiled text-cleaning patterns
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s\-.,!?:;()]')
+
 
 class DeduplicationStep:
     """
@@ -56,15 +71,40 @@ class DeduplicationStep:
         self.model_name = self.embedding_config['model_name']
         self.similarity_threshold = self.embedding_config['similarity_threshold']
         self.batch_size = self.embedding_config.get('batch_size', 50)
+        self.similarity_block_size = self.embedding_config.get('similarity_block_size', 512)
+        self.ann_min_articles = self.embedding_config.get('ann_min_articles', 2000)
+        self.hnsw_m = self.embedding_config.get('hnsw_m', 32)
+        self.hnsw_ef_construction = self.embedding_config.get('hnsw_ef_construction', 200)
+        self.hnsw_ef_search = self.embedding_config.get('hnsw_ef_search', 128)
+        # Reduced precision only pays off on GPU; on CPU without AMX bfloat16 is slower and
+        # shifts similarities near the threshold, so CPU keeps its own dtype setting
+        self.torch_dtype = self.embedding_config.get('torch_dtype', 'float32')
+        self.cpu_torch_dtype = self.embedding_config.get('cpu_torch_dtype', 'float32')
+        self.use_onnx = self.embedding_config.get('use_onnx', False)
+        self.onnx_file_name = self.embedding_config.get('onnx_file_name', 'onnx/model_qint8_avx512_vnni.onnx')
+        self.embedding_cache_enabled = self.embedding_config.get('cache_enabled', True)
+        self.embedding_cache_dir = resolve_pipeline_path(self.embedding_config.get('cache_dir', 'data/cache'))
+        self.embedding_cache_max_entries = self.embedding_config.get('cache_max_entries', 50000)
+        self.cpu_threads = self.embedding_config.get('cpu_threads')
+        self.device = self.embedding_config.get('device', 'auto')
+        self.gpu_batch_size = self.embedding_config.get('gpu_batch_size', 256)
+        self.attn_implementation = self.embedding_config.get('attn_implementation', 'sdpa')
+        self.torch_compile = self.embedding_config.get('torch_compile', False)
         
         # Deduplication configuration
         self.dedup_config = self.config['deduplication']
         self.max_articles = self.dedup_config['max_articles']
         self.quality_priority = self.dedup_config['quality_priority']
+        self.simhash_prefilter = self.dedup_config.get('simhash_prefilter', True)
+        self.simhash_max_distance = self.dedup_config.get('simhash_max_distance', 3)
+        self.small_input_fast_path = self.dedup_config.get('small_input_fast_path', False)
+        self.fast_path_max_ratio = self.dedup_config.get('fast_path_max_ratio', 1.2)
         
         # Initialize model
         self.model = None
         self.model_loaded = False
+        # Numeric path the embeddings come from (e.g. 'torch-float32'); set when the model loads
+        self.embedding_backend = None
         
     def _load_input_data(self) -> List[Dict[str, Any]]:
         """Load input data from LLM quality scoring step."""
@@ -82,33 +122,27 @@ class DeduplicationStep:
                 raise FileNotFoundError(f"Input file not found: {fixed_input}")
             self.logger.info(f"Loading input data from: {fixed_input}")
             
-            with open(fixed_input, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(fixed_input)
             
             articles = data.get('articles', [])
             quality_results = data.get('quality_results', [])
             
             self.logger.info(f"Loaded {len(articles)} articles from input file")
             
-            # Combine articles with their quality scores
-            articles_with_quality = []
+            # Attach quality information to the loaded article dicts in place
             for i, article in enumerate(articles):
-                article_with_quality = article.copy()
-                
-                # Add quality information if available
                 if i < len(quality_results):
                     quality_data = quality_results[i]
-                    article_with_quality['quality_score'] = quality_data.get('quality_metrics', {}).get('average_score', 0)
-                    article_with_quality['quality_level'] = quality_data.get('quality_metrics', {}).get('quality_level', 'unknown')
-                    article_with_quality['quality_analysis'] = quality_data.get('llm_analysis', {})
+                    quality_metrics = quality_data.get('quality_metrics', {})
+                    article['quality_score'] = quality_metrics.get('average_score', 0)
+                    article['quality_level'] = quality_metrics.get('quality_level', 'unknown')
+                    article['quality_analysis'] = quality_data.get('llm_analysis', {})
                 else:
-                    article_with_quality['quality_score'] = 0
-                    article_with_quality['quality_level'] = 'unknown'
-                    article_with_quality['quality_analysis'] = {}
-                
-                articles_with_quality.append(article_with_quality)
+                    article['quality_score'] = 0
+                    article['quality_level'] = 'unknown'
+                    article['quality_analysis'] = {}
             
-            return articles_with_quality
+            return articles
             
         except Exception as e:
             self.logger.error(f"Failed to load input data: {e}")
@@ -128,27 +162,8 @@ class DeduplicationStep:
             output_path = self.data_paths['processed']
             filepath = os.path.join(output_path, filename)
             
-            # Convert numpy types to Python native types for JSON serialization
-            def convert_numpy_types(obj):
-                """Recursively convert numpy types to Python native types."""
-                if isinstance(obj, np.integer):
-                    return int(obj)
-                elif isinstance(obj, np.floating):
-                    return float(obj)
-                elif isinstance(obj, np.ndarray):
-                    return obj.tolist()
-                elif isinstance(obj, dict):
-                    return {key: convert_numpy_types(value) for key, value in obj.items()}
-                elif isinstance(obj, list):
-                    return [convert_numpy_types(item) for item in obj]
-                else:
-                    return obj
-            
-            # Convert all numpy types before saving
-            output_data_serializable = convert_numpy_types(output_data)
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(output_data_serializable, f, indent=2, ensure_ascii=False)
+            # numpy scalars/arrays are serialized natively
+            dump_json(output_data, filepath)
             
             self.logger.info(f"Saved output data to: {filepath}")
             return filepath
@@ -163,13 +178,13 @@ class DeduplicationStep:
             return ""
             
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_PATTERN.sub('', text)
         
         # Normalize whitespace
         text = ' '.join(text.split())
         
         # Remove excessive punctuation but keep common punctuation
-        text = re.sub(r'[^\w\s\-.,!?:;()]', '', text)
+        text = _PUNCTUATION_PATTERN.sub('', text)
         
         return text.strip()
     
@@ -179,10 +194,39 @@ class DeduplicationStep:
             self.logger.error("❌ Sentence transformers not available. Install with: pip install sentence-transformers scikit-learn")
             return False
             
+        if self.use_onnx and self._load_onnx_embedding_model():
+            self.embedding_backend = f"onnx-{Path(self.onnx_file_name).stem}"
+            self.model_loaded = True
+            return True
+        
+        device = self.device
+        if device == 'auto':
+            device = 'cuda' if torch.cuda.is_available() else 'cpu'
+        
+        torch_dtype = self.torch_dtype if device.startswith('cuda') else self.cpu_torch_dtype
+        
         try:
-            self.logger.info(f"📥 Loading sentence transformer model: {self.model_name}")
-            self.model = SentenceTransformer(self.model_name)
-            self.logger.info(f"✅ Model loaded successfully")
+            self.logger.info(f"📥 Loading sentence transformer model: {self.model_name} ({torch_dtype}, {device})")
+            # Reduced-precision weights halve memory bandwidth; encode() still returns float32
+            model_kwargs = {'torch_dtype': getattr(torch, torch_dtype)}
+            if self.attn_implementation:
+                # Fused scaled_dot_product_attention kernels
+                model_kwargs['attn_implementation'] = self.attn_implementation
+            
+            self.model = SentenceTransformer(self.model_name, device=device, model_kwargs=model_kwargs)
+            self.embedding_backend = f"torch-{torch_dtype}"
+            self.logger.info(f"✅ Model loaded successfully on {device}")
+            
+            if self.torch_compile and device != 'cpu':
+                try:
+                    self.model[0].auto_model = torch.compile(self.model[0].auto_model, mode='reduce-overhead')
+                    self.logger.info("⚙️ Compiled transformer backbone with torch.compile")
+                except Exception as e:
+                    self.logger.warning(f"⚠️ torch.compile unavailable, using eager mode: {e}")
+            
+            if device == 'cuda':
+                # GPU throughput keeps improving well past the CPU-friendly batch size
+                self.batch_size = max(self.batch_size, self.gpu_batch_size)
             
             self.model_loaded = True
             return True
@@ -191,137 +235,438 @@ class DeduplicationStep:
             self.logger.error(f"❌ Error loading model: {e}")
             return False
     
-    def _prepare_text_for_embedding(self, article: Dict[str, Any]) -> str:
-        """Prepare article text for embedding generation."""
-        title = self._clean_text(article.get('title', ''))
-        content = self._clean_text(article.get('content', ''))
+    def _configure_cpu_threads(self) -> None:
+        """
+        Set torch's CPU thread count for encoding.
+        
+        Must run on the thread that later calls encode(): OpenMP thread settings are per
+        calling thread. Without an explicit cpu_threads, torch's own default (physical
+        cores) is kept rather than os.cpu_count(), which counts SMT siblings.
+        """
+        n_threads = self.cpu_threads or torch.get_num_threads()
+        torch.set_num_threads(n_threads)
+        try:
+            # Only allowed once, before any inter-op parallel work has started
+            torch.set_num_interop_threads(min(4, n_threads))
+        except RuntimeError:
+            pass
+        self.logger.info(f"🧵 Using {n_threads} CPU threads for embedding generation")
+    
+    def _load_onnx_embedding_model(self) -> bool:
+        """Load an int8-quantized ONNX Runtime backend for CPU encoding."""
+        try:
+            self.logger.info(f"📥 Loading ONNX embedding model: {self.model_name} ({self.onnx_file_name})")
+            self.model = SentenceTransformer(
+                self.model_name,
+                backend='onnx',
+                model_kwargs={'file_name': self.onnx_file_name, 'provider': 'CPUExecutionProvider'}
+            )
+            self.logger.info(f"✅ ONNX model loaded successfully")
+            return True
+            
+        except Exception as e:
+            self.logger.warning(f"⚠️ ONNX backend unavailable, falling back to PyTorch: {e}")
+            return False
+    
+    def _get_embedding_cache_path(self) -> Path:
+        """
+        Path of the persistent embedding cache for the configured model and loaded backend.
+        
+        int8 ONNX, reduced-precision torch and float32 torch embeddings differ slightly, so
+        each numeric path gets its own file rather than mixing vectors near the threshold.
+        """
+        safe_name = re.sub(r'[^\w\-.]', '_', f"{self.model_name}_{self.embedding_backend}")
+        return self.embedding_cache_dir / f"embeddings_{safe_name}.npz"
+    
+    def _load_embedding_cache(self) -> Tuple[Dict[bytes, int], Optional[np.ndarray]]:
+        """Load the on-disk embedding cache as (hash -> row index, embedding matrix)."""
+        cache_path = self._get_embedding_cache_path()
+        if not cache_path.exists():
+            return {}, None
         
-        # Combine title and content with separator
-        combined_text = f"{title} [SEP] {content}"
+        try:
+            with np.load(cache_path) as cache:
+                keys = cache['keys']
+                cached_embeddings = cache['emb']
+            if keys.dtype != np.uint8 or keys.ndim != 2 or keys.shape[1] != 16:
+                # Older caches stored keys as 'S16', which drops trailing NUL bytes
+                self.logger.info(f"♻️ Discarding embedding cache with outdated key format: {cache_path}")
+                return {}, None
+            return {key.tobytes(): row for row, key in enumerate(keys)}, cached_embeddings
+        except Exception as e:
+            self.logger.warning(f"⚠️ Ignoring unreadable embedding cache {cache_path}: {e}")
+            return {}, None
+    
+    def _save_embedding_cache(self, key_index: Dict[bytes, int], cached_embeddings: np.ndarray) -> None:
+        """Persist the embedding cache to disk."""
+        cache_path = self._get_embedding_cache_path()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Raw (N, 16) bytes: numpy 'S' strings would strip trailing NUL bytes from keys
+            ordered_keys = b''.join(sorted(key_index, key=key_index.get))
+            keys = np.frombuffer(ordered_keys, dtype=np.uint8).reshape(-1, 16)
+            with open(cache_path, 'wb') as f:
+                np.savez(f, keys=keys, emb=cached_embeddings)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to write embedding cache {cache_path}: {e}")
+    
+    def _trim_embedding_cache(self, key_index: Dict[bytes, int], cached_embeddings: np.ndarray,
+                              current_keys: List[bytes]) -> Tuple[Dict[bytes, int], np.ndarray]:
+        """
+        Cap the cache at cache_max_entries rows.
+        
+        Rows are appended in insertion order, so the oldest entries are evicted first;
+        rows used by the current run are always kept.
+        """
+        current = set(current_keys)
+        old_keys = [key for key in sorted(key_index, key=key_index.get) if key not in current]
+        n_old = max(0, self.embedding_cache_max_entries - len(current))
+        kept_keys = (old_keys[-n_old:] if n_old else []) + list(dict.fromkeys(current_keys))
+        
+        trimmed = cached_embeddings[[key_index[key] for key in kept_keys]]
+        self.logger.info(f"🧹 Evicted {len(key_index) - len(kept_keys)} old embedding cache entries")
+        return {key: row for row, key in enumerate(kept_keys)}, trimmed
+    
+    def _encode_texts(self, texts: List[str]) -> np.ndarray:
+        """Encode texts into unit-normalized embeddings, preserving input order."""
+        # Smart batching: encode texts of similar length together to minimise padding
+        order = np.argsort([len(text) for text in texts], kind='stable')
+        sorted_texts = [texts[idx] for idx in order]
+        
+        # sentence-transformers batches internally; one call avoids per-batch Python overhead
+        sorted_embeddings = self.model.encode(
+            sorted_texts,
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False
+        )
+        
+        # Restore the original article order
+        embeddings = np.empty_like(sorted_embeddings)
+        embeddings[order] = sorted_embeddings
         
-        return combined_text
+        return embeddings
+    
+    def _simhash(self, text: str) -> int:
+        """64-bit SimHash over lowercase word 3-gram shingles."""
+        words = text.lower().split()
+        if not words:
+            return 0
+        
+        shingles = [' '.join(words[i:i + 3]) for i in range(max(1, len(words) - 2))]
+        digests = b''.join(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest() for shingle in shingles)
+        bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8), axis=1)
+        
+        # Each bit is set when the majority of shingle hashes have it set
+        fingerprint = np.packbits(bits.sum(axis=0) * 2 > len(shingles))
+        return int.from_bytes(fingerprint.tobytes(), 'big')
     
-    def _generate_embeddings(self, articles: List[Dict[str, Any]]) -> np.ndarray:
-        """Generate embeddings for all articles."""
+    def _find_near_exact_duplicates(self, texts: List[str]) -> np.ndarray:
+        """
+        Map every text to a representative index using SimHash.
+        
+        Fingerprints are split into four 16-bit bands; texts sharing any band are
+        candidates and are merged when their Hamming distance is within the limit.
+        
+        Returns:
+            Array where entry i is the index of the representative text for text i
+        """
+        n = len(texts)
+        fingerprints = [self._simhash(text) for text in texts]
+        
+        buckets = defaultdict(list)
+        for idx, fingerprint in enumerate(fingerprints):
+            for band in range(4):
+                buckets[(band, (fingerprint >> (16 * band)) & 0xFFFF)].append(idx)
+        
+        edges = set()
+        for members in buckets.values():
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    if (fingerprints[i] ^ fingerprints[j]).bit_count() <= self.simhash_max_distance:
+                        edges.add((i, j))
+        
+        if not edges:
+            return np.arange(n)
+        
+        rows, cols = zip(*edges)
+        graph = csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+        _, labels = connected_components(graph, directed=False)
+        
+        # Lowest index in each cluster is its representative
+        _, first_index, inverse = np.unique(labels, return_index=True, return_inverse=True)
+        return first_index[inverse]
+    
+    def _prepare_embedding_texts(self, articles: List[Dict[str, Any]]) -> List[str]:
+        """Build the cleaned 'title [SEP] content' text for every article."""
         self.logger.info("🔄 Preparing texts for embedding generation...")
         
-        texts = []
-        for article in articles:
-            text = self._prepare_text_for_embedding(article)
-            texts.append(text)
-        
-        self.logger.info(f"🧠 Generating embeddings for {len(texts)} articles...")
-        
-        # Process in batches to avoid memory issues
-        embeddings = []
-        
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i:i + self.batch_size]
-            batch_embeddings = self.model.encode(batch, convert_to_tensor=False, show_progress_bar=False)
-            embeddings.extend(batch_embeddings)
+        # Combine cleaned title and content with separator in a single pass
+        clean_text = self._clean_text
+        return [
+            f"{clean_text(article.get('title', ''))} [SEP] {clean_text(article.get('content', ''))}"
+            for article in articles
+        ]
+    
+    def _generate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """Generate embeddings for prepared article texts."""
+        if not self.simhash_prefilter:
+            embeddings = self._embed_texts(texts)
+        else:
+            # Near-verbatim reposts share their representative's embedding, which
+            # places them in the same similarity group without running the encoder
+            representatives = self._find_near_exact_duplicates(texts)
+            unique_indices, inverse = np.unique(representatives, return_inverse=True)
+            if len(unique_indices) < len(texts):
+                self.logger.info(f"🔁 SimHash pre-filter: {len(texts) - len(unique_indices)} near-exact duplicates skip encoding")
+            embeddings = self._embed_texts([texts[idx] for idx in unique_indices])[inverse]
+        
+        # float32, C-contiguous rows so the similarity matmul maps straight onto SGEMM
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
+    
+    def _embed_texts(self, texts: List[str]) -> np.ndarray:
+        """Embed prepared texts, reusing cached embeddings where possible."""
+        if not self.embedding_cache_enabled:
+            self.logger.info(f"🧠 Generating embeddings for {len(texts)} articles...")
+            embeddings = self._encode_texts(texts)
+            self.logger.info(f"✅ Generated embeddings: {embeddings.shape}")
+            return embeddings
+        
+        hashes = [hashlib.sha1(text.encode('utf-8')).digest()[:16] for text in texts]
+        key_index, cached_embeddings = self._load_embedding_cache()
+        
+        miss_positions = [i for i, key in enumerate(hashes) if key not in key_index]
+        self.logger.info(f"🧠 Generating embeddings for {len(miss_positions)} articles "
+                         f"({len(texts) - len(miss_positions)} cached)...")
+        
+        if miss_positions:
+            new_embeddings = self._encode_texts([texts[i] for i in miss_positions])
+            if cached_embeddings is None or cached_embeddings.shape[1] != new_embeddings.shape[1]:
+                key_index, cached_embeddings = {}, new_embeddings[:0]
+            
+            # Append new rows (deduplicating identical texts within this run) into a
+            # preallocated matrix rather than collecting rows in a list first
+            new_rows = {}
+            for offset, pos in enumerate(miss_positions):
+                new_rows.setdefault(hashes[pos], offset)
+            
+            n_cached = len(cached_embeddings)
+            grown = np.empty((n_cached + len(new_rows), new_embeddings.shape[1]), dtype=np.float32)
+            grown[:n_cached] = cached_embeddings
+            grown[n_cached:] = new_embeddings[list(new_rows.values())]
+            for row, key in enumerate(new_rows, start=n_cached):
+                key_index[key] = row
+            cached_embeddings = grown
             
-            if (i // self.batch_size + 1) % 10 == 0:  # Log progress every 10 batches
-                self.logger.info(f"   Processed {i + len(batch)}/{len(texts)} articles")
+            if len(key_index) > self.embedding_cache_max_entries:
+                key_index, cached_embeddings = self._trim_embedding_cache(key_index, cached_embeddings, hashes)
+            self._save_embedding_cache(key_index, cached_embeddings)
         
-        embeddings = np.array(embeddings)
+        embeddings = cached_embeddings[[key_index[key] for key in hashes]]
         self.logger.info(f"✅ Generated embeddings: {embeddings.shape}")
         
         return embeddings
     
-    def _find_similar_articles(self, embeddings: np.ndarray, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Find similar articles using cosine similarity."""
-        self.logger.info(f"📊 Calculating similarity matrix...")
-        similarity_matrix = cosine_similarity(embeddings)
+    def _find_similarity_edges(self, embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find all article pairs (i < j) whose cosine similarity exceeds the threshold.
+        
+        Similarities are computed in row blocks so only a block_size x N slice is
+        held in memory at a time instead of the full N x N matrix.
+        
+        Returns:
+            Tuple of (rows, cols, similarities) describing the above-threshold edges
+        """
+        n = len(embeddings)
+        if FAISS_AVAILABLE and n >= self.ann_min_articles:
+            return self._find_similarity_edges_ann(embeddings)
+        
+        block_size = max(1, self.similarity_block_size)
+        self.logger.info(f"📊 Calculating blocked similarity edges (block size {block_size})...")
+        rows, cols, sims = [], [], []
+        
+        for start in range(0, n, block_size):
+            block = np.matmul(embeddings[start:start + block_size], embeddings.T)
+            # Keep only the strict upper triangle (j > i) of the global matrix
+            block = np.triu(block, k=start + 1)
+            block_rows, block_cols = np.where(block > self.similarity_threshold)
+            rows.append(block_rows + start)
+            cols.append(block_cols)
+            sims.append(block[block_rows, block_cols])
+        
+        if not rows:
+            return np.array([], dtype=int), np.array([], dtype=int), np.array([], dtype=np.float32)
+        
+        return np.concatenate(rows), np.concatenate(cols), np.concatenate(sims)
+    
+    def _find_similarity_edges_ann(self, embeddings: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Approximate above-threshold pairs with a FAISS HNSW inner-product range search."""
+        self.logger.info(f"🧭 Using FAISS HNSW range search for {len(embeddings)} articles")
         
+        index = faiss.IndexHNSWFlat(embeddings.shape[1], self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+        index.hnsw.efConstruction = self.hnsw_ef_construction
+        index.hnsw.efSearch = self.hnsw_ef_search
+        index.add(embeddings)
+        
+        lims, sims, cols = index.range_search(embeddings, self.similarity_threshold)
+        rows = np.repeat(np.arange(len(embeddings)), np.diff(lims.astype(np.int64)))
+        
+        # Keep each pair once (i < j), matching the exact path
+        upper = cols > rows
+        return rows[upper], cols[upper].astype(int), sims[upper]
+    
+    def _find_similar_articles(self, embeddings: np.ndarray, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Find similar articles using cosine similarity (embeddings are unit-normalized)."""
         self.logger.info(f"🔍 Finding similar articles with threshold > {self.similarity_threshold}...")
+        edge_rows, edge_cols, edge_sims = self._find_similarity_edges(embeddings)
         
-        # Track which articles have been processed
-        processed = set()
-        similar_groups = []
+        # Group transitively similar articles as connected components of the threshold graph
+        n = len(embeddings)
+        graph = csr_matrix((np.ones(len(edge_rows)), (edge_rows, edge_cols)), shape=(n, n))
+        n_components, labels = connected_components(graph, directed=False)
+        
+        # Strongest edge inside each component
+        component_max_similarity = np.zeros(n_components)
+        if len(edge_sims):
+            np.maximum.at(component_max_similarity, labels[edge_rows], edge_sims)
         
-        for i in range(len(similarity_matrix)):
-            if i in processed:
-                continue
-                
-            # Find articles similar to article i
-            similar_indices = []
-            for j in range(i + 1, len(similarity_matrix)):
-                if j not in processed and similarity_matrix[i][j] > self.similarity_threshold:
-                    similar_indices.append(j)
+        # Split article indices by component label in one vectorized pass, then order
+        # components by their first (lowest-index) article to keep input order
+        order = np.argsort(labels, kind='stable')
+        components = np.split(order, np.flatnonzero(np.diff(labels[order])) + 1)
+        components.sort(key=lambda members: members[0])
+        
+        quality = np.array([article.get('quality_score', 0) for article in articles], dtype=float)
+        
+        similar_groups = []
+        for members in components:
+            label = labels[members[0]]
+            group_indices = members.tolist()
+            main_index = group_indices[0]
+            similar_indices = group_indices[1:]
             
+            # Add similarity scores (relative to the main article) for analysis;
+            # only grouped articles carry one, as singletons never had a comparison
+            group_sims = embeddings[group_indices] @ embeddings[main_index]
             if similar_indices:
-                # Create a group with the main article and all similar ones
-                group_indices = [i] + similar_indices
-                group_articles = [articles[idx] for idx in group_indices]
-                
-                # Add similarity scores for analysis
-                for idx, article in enumerate(group_articles):
-                    article['similarity_score'] = similarity_matrix[i][group_indices[idx]]
-                
-                similar_groups.append({
-                    'main_article_index': i,
-                    'similar_indices': similar_indices,
-                    'articles': group_articles,
-                    'max_similarity': max([similarity_matrix[i][j] for j in similar_indices]),
-                    'group_size': len(group_articles)
-                })
-                
-                # Mark all articles in this group as processed
-                processed.update(group_indices)
+                for idx, sim in zip(group_indices, group_sims.tolist()):
+                    articles[idx]['similarity_score'] = sim
+            
+            # Pick the group winner with a single argmax instead of sorting the group
+            if self.quality_priority:
+                best_position = int(np.argmax(quality[group_indices]))
             else:
-                # Single article (no duplicates found)
-                similar_groups.append({
-                    'main_article_index': i,
-                    'similar_indices': [],
-                    'articles': [articles[i]],
-                    'max_similarity': 0.0,
-                    'group_size': 1
-                })
-                processed.add(i)
+                # If no quality scores available, prefer the highest similarity score
+                best_position = int(np.argmax(group_sims))
+            
+            # Keep competitors as indices; readable summaries are built once at save time
+            competing_positions = [pos for pos in range(len(group_indices)) if pos != best_position]
+            
+            similar_groups.append({
+                'main_article_index': main_index,
+                'similar_indices': similar_indices,
+                'best_article_index': group_indices[best_position],
+                'competing_indices': [group_indices[pos] for pos in competing_positions],
+                'competing_similarities': group_sims[competing_positions].astype(np.float32),
+                'max_similarity': float(component_max_similarity[label]) if similar_indices else 0.0,
+                'group_size': len(group_indices)
+            })
         
         return similar_groups
     
-    def _select_best_article_from_group(self, group: Dict[str, Any]) -> Dict[str, Any]:
-        """Select the best article from a group of similar articles."""
-        articles = group['articles']
-        
-        if len(articles) == 1:
-            return articles[0]
+    def _singleton_group(self, index: int) -> Dict[str, Any]:
+        """Group record for an article with no duplicates."""
+        return {
+            'main_article_index': index,
+            'similar_indices': [],
+            'best_article_index': index,
+            'competing_indices': [],
+            'competing_similarities': np.zeros(0, dtype=np.float32),
+            'max_similarity': 0.0,
+            'group_size': 1
+        }
+    
+    def _can_skip_embedding(self, articles: List[Dict[str, Any]]) -> bool:
+        """
+        Whether the input is small enough, with distinct titles, to skip embedding entirely.
+        
+        Only exact title repeats are detected, so near-duplicates from different feeds pass
+        through; the fast path is opt-in for that reason.
+        """
+        if not self.small_input_fast_path or len(articles) > self.max_articles * self.fast_path_max_ratio:
+            return False
         
-        # Sort by quality score (descending)
-        if self.quality_priority:
-            articles_sorted = sorted(articles, key=lambda x: x.get('quality_score', 0), reverse=True)
-        else:
-            # If no quality scores available, sort by similarity score (descending)
-            articles_sorted = sorted(articles, key=lambda x: x.get('similarity_score', 0), reverse=True)
+        title_hashes = {hashlib.sha1(article.get('title', '').encode('utf-8')).digest() for article in articles}
+        return len(title_hashes) == len(articles)
+    
+    def _select_best_article_from_group(self, group: Dict[str, Any], articles: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Select the best article from a group of similar articles."""
+        # Winner was chosen while building the group
+        best_article = articles[group['best_article_index']]
         
-        best_article = articles_sorted[0]
+        if group['group_size'] == 1:
+            return best_article
         
-        # Add information about the group for analysis
+        # Add information about the group for analysis (competing_articles is filled in at save time)
         best_article['deduplication_info'] = {
-            'was_duplicate': len(articles) > 1,
-            'group_size': len(articles),
-            'max_similarity': group['max_similarity'],
-            'competing_articles': [
-                {
-                    'title': art['title'],
-                    'feed_name': art.get('feed_name', 'Unknown'),
-                    'quality_score': art.get('quality_score', 0),
-                    'similarity_score': art.get('similarity_score', 0)
-                }
-                for art in articles[1:]  # Exclude the selected article
-            ]
+            'was_duplicate': True,
+            'group_size': group['group_size'],
+            'max_similarity': group['max_similarity']
         }
         
         return best_article
     
+    def _build_similar_groups_analysis(self, duplicate_groups: List[Dict[str, Any]],
+                                       articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Materialize readable group summaries, sharing each competitor list with the winning article."""
+        analysis = []
+        for i, group in enumerate(duplicate_groups):
+            selected = articles[group['best_article_index']]
+            competing_articles = [
+                {
+                    'title': articles[idx]['title'],
+                    'feed_name': articles[idx].get('feed_name', 'Unknown'),
+                    'quality_score': articles[idx].get('quality_score', 0),
+                    'similarity_score': similarity
+                }
+                for idx, similarity in zip(group['competing_indices'], group['competing_similarities'].tolist())
+            ]
+            selected['deduplication_info']['competing_articles'] = competing_articles
+            
+            analysis.append({
+                'group_id': i,
+                'group_size': group['group_size'],
+                'max_similarity': group['max_similarity'],
+                'selected_article': {
+                    'title': selected['title'],
+                    'feed_name': selected.get('feed_name', 'Unknown'),
+                    'quality_score': selected.get('quality_score', 0)
+                },
+                'competing_articles': competing_articles
+            })
+        
+        return analysis
+    
     def _select_top_articles(self, unique_articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Select the top N articles based on quality scores."""
-        # Sort by quality score (descending)
-        sorted_articles = sorted(unique_articles, key=lambda x: x.get('quality_score', 0), reverse=True)
+        quality = np.array([article.get('quality_score', 0) for article in unique_articles], dtype=float)
+        n, k = len(quality), self.max_articles
+        
+        if n <= k:
+            candidates = np.arange(n)
+        elif k <= 0:
+            candidates = np.array([], dtype=int)
+        else:
+            # Partial selection: everything above the k-th score plus the earliest ties at it
+            kth_score = np.partition(quality, n - k)[n - k]
+            above = np.flatnonzero(quality > kth_score)
+            ties = np.flatnonzero(quality == kth_score)[:k - len(above)]
+            candidates = np.concatenate([above, ties])
         
-        # Take top N articles
-        top_articles = sorted_articles[:self.max_articles]
+        # Order only the selected articles: quality descending, input order on ties
+        candidates = candidates[np.lexsort((candidates, -quality[candidates]))]
+        top_articles = [unique_articles[idx] for idx in candidates]
         
         self.logger.info(f"📊 Selected top {len(top_articles)} articles from {len(unique_articles)} unique articles")
         
@@ -331,16 +676,6 @@ class DeduplicationStep:
         """Execute the deduplication step."""
         self.logger.info("🚀 Starting deduplication step")
         
-        # Load embedding model
-        if not self._load_embedding_model():
-            return {
-                'success': False,
-                'error': 'Failed to load embedding model',
-                'articles_input': 0,
-                'articles_passed': 0,
-                'pass_rate': 0.0
-            }
-        
         # Load input data
         articles = self._load_input_data()
         if not articles:
@@ -358,16 +693,41 @@ class DeduplicationStep:
         # Process articles
         start_time = time.time()
         
-        # Generate embeddings
-        embeddings = self._generate_embeddings(articles)
-        
-        # Find similar articles
-        similar_groups = self._find_similar_articles(embeddings, articles)
+        fast_path = self._can_skip_embedding(articles)
+        if fast_path:
+            # Small input with distinct titles: every article is its own group
+            self.logger.info("⚡ Small input with unique titles, skipping embedding-based deduplication")
+            similar_groups = [self._singleton_group(i) for i in range(len(articles))]
+        else:
+            # Load the embedding model while the texts are cleaned and pre-filtered;
+            # the CPU-side preparation is hidden behind the (much slower) model load
+            if SENTENCE_TRANSFORMERS_AVAILABLE:
+                # On this (the encoding) thread, before the model load is handed off
+                self._configure_cpu_threads()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                model_future = executor.submit(self._load_embedding_model)
+                texts = self._prepare_embedding_texts(articles)
+                model_loaded = model_future.result()
+            
+            if not model_loaded:
+                return {
+                    'success': False,
+                    'error': 'Failed to load embedding model',
+                    'articles_input': 0,
+                    'articles_passed': 0,
+                    'pass_rate': 0.0
+                }
+            
+            # Generate embeddings
+            embeddings = self._generate_embeddings(texts)
+            
+            # Find similar articles
+            similar_groups = self._find_similar_articles(embeddings, articles)
         
         # Select best article from each group
         unique_articles = []
         for group in similar_groups:
-            best_article = self._select_best_article_from_group(group)
+            best_article = self._select_best_article_from_group(group, articles)
             unique_articles.append(best_article)
         
         # Select top N articles
@@ -387,7 +747,8 @@ class DeduplicationStep:
                 'processing_time_seconds': processing_time,
                 'embedding_model': self.model_name,
                 'similarity_threshold': self.similarity_threshold,
-                'max_articles': self.max_articles
+                'max_articles': self.max_articles,
+                'embedding_skipped': fast_path
             },
             'statistics': {
                 'articles_input': len(articles),
@@ -398,28 +759,7 @@ class DeduplicationStep:
                 'deduplication_rate': (total_duplicates_found / len(articles)) * 100 if articles else 0,
                 'selection_rate': (len(top_articles) / len(articles)) * 100 if articles else 0
             },
-            'similar_groups_analysis': [
-                {
-                    'group_id': i,
-                    'group_size': group['group_size'],
-                    'max_similarity': group['max_similarity'],
-                    'selected_article': {
-                        'title': group['articles'][0]['title'],
-                        'feed_name': group['articles'][0].get('feed_name', 'Unknown'),
-                        'quality_score': group['articles'][0].get('quality_score', 0)
-                    },
-                    'competing_articles': [
-                        {
-                            'title': art['title'],
-                            'feed_name': art.get('feed_name', 'Unknown'),
-                            'quality_score': art.get('quality_score', 0),
-                            'similarity_score': art.get('similarity_score', 0)
-                        }
-                        for art in group['articles'][1:] if len(group['articles']) > 1
-                    ]
-                }
-                for i, group in enumerate(duplicate_groups)
-            ],
+            'similar_groups_analysis': self._build_similar_groups_analysis(duplicate_groups, articles),
             'articles': top_articles
         }
         
@@ -440,8 +780,8 @@ class DeduplicationStep:
             self.logger.info(f"\n🔍 Top duplicate groups found:")
             for i, group in enumerate(duplicate_groups[:5], 1):
                 self.logger.info(f"   {i}. Group size: {group['group_size']}, Max similarity: {group['max_similarity']:.3f}")
-                self.logger.info(f"      Selected: {group['articles'][0]['title'][:60]}...")
-                for j, art in enumerate(group['articles'][1:], 1):
+                self.logger.info(f"      Selected: {articles[group['best_article_index']]['title'][:60]}...")
+                for j, art in enumerate((articles[idx] for idx in group['competing_indices']), 1):
                     self.logger.info(f"      Removed {j}: {art['title'][:60]}... (Q:{art.get('quality_score', 0):.1f})")
         
         # Show top articles by quality
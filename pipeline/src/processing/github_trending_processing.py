@@ -5,15 +5,18 @@ This module handles processing GitHub trending repositories for newsletter integ
 Includes LLM ranking, description generation, and newsletter formatting.
 """
 
+import os
+import copy
 import sys
-import json
-import time
-import re
-import random
+import asyncio
+import threading
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Any, Optional
-import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -21,6 +24,78 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.utils.logger import get_logger
 from src.utils.config_loader import ConfigLoader
 from src.utils.together_client import create_together_client
+from src.utils.json_utils import load_json, loads_json, find_json_object, dump_json
+
+try:
+    import ollama
+    OLLAMA_AVAILABLE = True
+except ImportError:
+    OLLAMA_AVAILABLE = False
+
+# Character prefix of a README scanned for its first 100 words
+_README_PREVIEW_CHARS = 1500
+
+# Markdown emphasis and code characters removed from generated descriptions
+_MD_STRIP = str.maketrans('', '', '*`')
+
+_RANKING_HEADER = """You are an expert tech analyst. Your task is to rank the provided GitHub repositories from 1–10 based on their potential impact and innovation.
+
+Ranking criteria:
+1. Innovation & Technical Merit: How novel or technically impressive is the project?
+2. Potential Impact: How likely is this to influence the developer community or industry?
+3. Practical Value: How useful would this be for developers?
+4. Code Quality Indicators: Based on README quality and project description.
+5. Trending Potential: How likely is this to continue growing in popularity?
+
+STRICT OUTPUT RULES:
+- Respond with ONLY a valid JSON object.
+- Do not include markdown code blocks, explanations, comments, or extra text.
+- Each repo must have a unique rank from 1–10.
+- Use repo_name exactly as provided (no modifications).
+- Each reason must be ≤25 words and reference one or more ranking criteria.
+- Each summary must be a plain-text, jargon-free description of what the project does, ≤25 words, no hype.
+- overall_analysis must be ≤50 words summarizing observed quality and trends.
+
+Required JSON format:
+{
+  "rankings": [
+    {"rank": 1, "repo_name": "exact_repo_name", "reason": "brief explanation", "summary": "what the project does"},
+    ...
+    {"rank": 10, "repo_name": "exact_repo_name", "reason": "brief explanation", "summary": "what the project does"}
+  ],
+  "overall_analysis": "Brief summary of overall quality and trends"
+}
+
+Repositories to rank:
+
+"""
+
+
+# Newsletter payload used when no GitHub trending data can be processed
+_FALLBACK_TEMPLATE = {
+    "metadata": {
+        "title": "Trending GitHub Repositories",
+        "subtitle": "Top repositories from the past 24 hours",
+        "generated_at": None,
+        "ranking_source": "Fallback",
+        "total_repositories": 1,
+        "source_data": {
+            "total_fetched": 0,
+            "total_filtered": 0,
+            "total_with_readme": 0
+        }
+    },
+    "repositories": [{
+        "rank": 1,
+        "repo_name": "bahamas10/ysap",
+        "primary_language": "Shell",
+        "stars": 642,
+        "github_url": "https://github.com/bahamas10/ysap",
+        "original_description": "You Suck at Programming - A series on programming (actually just bash scripting) on youtube, tiktok and instagram hosted by Dave Eddy.",
+        "summary": "Our content pipeline encountered technical difficulties. We're working to restore normal service and will have fresh trending repositories for you soon. Please come back tomorrow!",
+        "status": "fallback"
+    }]
+}
 
 
 class GitHubTrendingProcessor:
@@ -48,13 +123,53 @@ class GitHubTrendingProcessor:
         else:
             # Fallback to Ollama configuration
             self.ollama_host = llm_config.get('ollama', {}).get('server_url', 'http://172.22.128.1:11434').replace('http://', '').replace(':11434', '')
-            self.model_name = llm_config.get('ollama', {}).get('model', 'llama3.2:3b')
+            self.model_name = llm_config.get('ollama', {}).get('model', 'llama3.2:3b-instruct-q4_K_M')
             self.api_url = f"http://{self.ollama_host}:11434/api/generate"
-        
-        # Set random seed for reproducible results
-        random.seed(42)
-        
-        self.logger.info("GitHub trending processor initialized with seed 42")
+            # Keep the model resident between the ranking and description calls
+            self.keep_alive = llm_config.get('ollama', {}).get('keep_alive', -1)
+        
+        # Pooled keep-alive session reused for every Ollama request in a run;
+        # transient connection resets and gateway errors are retried briefly
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(
+                total=2,
+                connect=2,
+                read=0,  # Never re-send a POST after a read timeout; that only multiplies the wait
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['POST'])
+            )
+        ))
+        
+        # Warm the model in the background so the ranking call doesn't pay the cold load
+        if self.provider != 'together_ai':
+            threading.Thread(target=self._preload_ollama_model, daemon=True).start()
+        
+        self.logger.info("GitHub trending processor initialized")
+    
+    def _preload_ollama_model(self) -> None:
+        """Load the Ollama model into memory and keep it resident for the run."""
+        try:
+            self.session.post(
+                self.api_url,
+                json={"model": self.model_name, "prompt": "", "keep_alive": self.keep_alive},
+                timeout=(3, 120)
+            )
+            self.logger.debug(f"Preloaded Ollama model {self.model_name}")
+        except Exception as e:
+            self.logger.warning(f"Ollama model preload failed: {e}")
+    
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+    
+    def __del__(self):
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
     
     def _create_ranking_prompt(self, repositories: List[Dict[str, Any]]) -> str:
         """
@@ -66,48 +181,25 @@ class GitHubTrendingProcessor:
         Returns:
             str: Formatted prompt for LLM
         """
-        prompt = """You are an expert tech analyst. Your task is to rank the provided GitHub repositories from 1–10 based on their potential impact and innovation.
-
-Ranking criteria:
-1. Innovation & Technical Merit: How novel or technically impressive is the project?
-2. Potential Impact: How likely is this to influence the developer community or industry?
-3. Practical Value: How useful would this be for developers?
-4. Code Quality Indicators: Based on README quality and project description.
-5. Trending Potential: How likely is this to continue growing in popularity?
-
-STRICT OUTPUT RULES:
-- Respond with ONLY a valid JSON object.
-- Do not include markdown code blocks, explanations, comments, or extra text.
-- Each repo must have a unique rank from 1–10.
-- Use repo_name exactly as provided (no modifications).
-- Each reason must be ≤25 words and reference one or more ranking criteria.
-- overall_analysis must be ≤50 words summarizing observed quality and trends.
-
-Required JSON format:
-{
-  "rankings": [
-    {"rank": 1, "repo_name": "exact_repo_name", "reason": "brief explanation"},
-    ...
-    {"rank": 10, "repo_name": "exact_repo_name", "reason": "brief explanation"}
-  ],
-  "overall_analysis": "Brief summary of overall quality and trends"
-}
-
-Repositories to rank:
-
-"""
-        
-        for i, repo in enumerate(repositories, 1):
-            prompt += f"{i}. **{repo['repo_name']}** ({repo['primary_language']}) - {repo['stars']} stars\n"
-            prompt += f"   Description: {repo['description']}\n"
-            
-            if repo.get('readme_preview'):
-                prompt += f"   README: {repo['readme_preview']}\n"
-            else:
-                prompt += f"   README: Not available\n"
-            prompt += "\n"
-        
-        return prompt
+        key = tuple(
+            (repo['repo_name'], repo['primary_language'], repo['stars'],
+             repo['description'], repo.get('readme_preview'))
+            for repo in repositories
+        )
+        return self._ranking_prompt_cached(key)
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _ranking_prompt_cached(repositories: tuple) -> str:
+        """Build the ranking prompt from (name, language, stars, description, readme) tuples."""
+        parts = [_RANKING_HEADER]
+        
+        for i, (repo_name, language, stars, description, readme_preview) in enumerate(repositories, 1):
+            parts.append(f"{i}. **{repo_name}** ({language}) - {stars} stars\n")
+            parts.append(f"   Description: {description}\n")
+            parts.append(f"   README: {readme_preview or 'Not available'}\n\n")
+        
+        return "".join(parts)
     
     def _get_llm_ranking(self, repositories: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """
@@ -129,21 +221,21 @@ Repositories to rank:
                 return response
             else:
                 # Fallback to Ollama
-                import requests
-                
                 payload = {
                     "model": self.model_name,
                     "prompt": prompt,
                     "stream": False,
+                    "keep_alive": self.keep_alive,
+                    "format": "json",  # Constrained decoding: response is always a JSON object
                     "options": {
                         "temperature": 0.3,  # Lower temperature for more consistent rankings
                         "top_p": 0.9,
-                        "max_tokens": 2000
+                        "num_predict": 3500  # Room for a summary per ranked repo
                     }
                 }
                 
                 self.logger.info(f"🤖 Sending ranking request to Ollama at {self.ollama_host}...")
-                response = requests.post(self.api_url, json=payload, timeout=60)
+                response = self.session.post(self.api_url, json=payload, timeout=(3, 60))
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -171,56 +263,27 @@ Repositories to rank:
         if not response_text:
             return None
         
-        # Clean the response text
-        response_text = response_text.strip()
+        # Strip markdown code fences, then try the whole response as JSON
+        response_text = response_text.replace('```json', '').replace('```', '').strip()
         
         try:
-            # Method 1: Try to parse the entire response as JSON
-            try:
-                ranking_data = json.loads(response_text)
-                return ranking_data
-            except:
-                pass
-            
-            # Method 2: Try to find JSON object in the response
-            start_idx = response_text.find('{')
-            end_idx = response_text.rfind('}') + 1
-            
-            if start_idx != -1 and end_idx > start_idx:
-                json_str = response_text[start_idx:end_idx]
-                ranking_data = json.loads(json_str)
+            ranking_data = loads_json(response_text)
+            if isinstance(ranking_data, dict):
                 return ranking_data
-            
-            # Method 3: Try to extract from markdown code blocks
-            if '```json' in response_text:
-                start = response_text.find('```json') + 7
-                end = response_text.find('```', start)
-                if end > start:
-                    json_str = response_text[start:end].strip()
-                    ranking_data = json.loads(json_str)
-                    return ranking_data
-            
-            # Method 4: Try to extract from code blocks without json marker
-            if '```' in response_text:
-                parts = response_text.split('```')
-                for part in parts:
-                    part = part.strip()
-                    if part.startswith('{') and part.endswith('}'):
-                        try:
-                            ranking_data = json.loads(part)
-                            return ranking_data
-                        except:
-                            continue
-            
+        except ValueError:
+            pass
+        
+        # Otherwise take the first balanced JSON object in the response
+        json_str = find_json_object(response_text)
+        if json_str is None:
             self.logger.warning("⚠️  No valid JSON found in LLM response")
             return None
-                
-        except json.JSONDecodeError as e:
+        
+        try:
+            return loads_json(json_str)
+        except ValueError as e:
             self.logger.warning(f"⚠️  JSON parsing error: {e}")
             return None
-        except Exception as e:
-            self.logger.warning(f"⚠️  Unexpected parsing error: {e}")
-            return None
     
     def _create_description_prompt(self, repo_info: Dict[str, Any]) -> str:
         """
@@ -232,6 +295,12 @@ Repositories to rank:
         Returns:
             str: Formatted prompt for LLM
         """
+        return self._description_prompt_cached(repo_info['repo_name'], repo_info['description'])
+    
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _description_prompt_cached(repo_name: str, description: str) -> str:
+        """Build the description prompt for one repository."""
         prompt = f"""You are a technical writer for a developer-focused newsletter.  
 Write a 1–2 sentence description of the given GitHub repository.  
 
@@ -241,12 +310,107 @@ Requirements:
 - Focus only on what the project does.  
 - No hype, no extra details.  
 
-Input: {repo_info['repo_name']} - {repo_info['description']}
+Input: {repo_name} - {description}
 
 Output: Plain text, 1–2 sentences."""
         
         return prompt
     
+    def _create_batched_description_prompt(self, repositories: List[Dict[str, Any]]) -> str:
+        """
+        Create a single prompt asking for descriptions of several repositories.
+        
+        Args:
+            repositories: List of repository information
+            
+        Returns:
+            str: Formatted prompt for LLM
+        """
+        prompt = """You are a technical writer for a developer-focused newsletter.
+Write a 1–2 sentence description of each GitHub repository listed below.
+
+Requirements:
+- Maximum 25 words per description.
+- Simple, clear, and jargon-free.
+- Focus only on what the project does.
+- No hype, no extra details.
+
+STRICT OUTPUT RULES:
+- Respond with ONLY a valid JSON object.
+- Do not include markdown code blocks, explanations, comments, or extra text.
+- Use repo_name exactly as provided (no modifications).
+- Include one entry per repository, in the order given.
+
+Required JSON format:
+{
+  "descriptions": [
+    {"repo_name": "exact_repo_name", "summary": "plain text description"}
+  ]
+}
+
+Repositories:
+
+"""
+        
+        for i, repo in enumerate(repositories, 1):
+            prompt += f"{i}. {repo['repo_name']} - {repo['description']}\n"
+        
+        return prompt
+    
+    def _generate_batched_descriptions(self, repositories: List[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+        """
+        Generate descriptions for all repositories with a single LLM request.
+        
+        Args:
+            repositories: List of repository information
+            
+        Returns:
+            dict: Mapping of repo_name to description, or None if the request or parsing failed
+        """
+        prompt = self._create_batched_description_prompt(repositories)
+        
+        try:
+            if self.provider == 'together_ai':
+                response_text = self.llm_client.generate_completion(prompt)
+            else:
+                # Fallback to Ollama
+                payload = {
+                    "model": self.model_name,
+                    "prompt": prompt,
+                    "stream": False,
+                    "keep_alive": self.keep_alive,
+                    "format": "json",
+                    "options": {
+                        "temperature": 0.3,
+                        "num_predict": 150 * len(repositories)
+                    }
+                }
+                
+                response = self.session.post(self.api_url, json=payload, timeout=(3, 60))
+                
+                if response.status_code != 200:
+                    self.logger.warning(f"⚠️  Ollama API error: {response.status_code} - {response.text}")
+                    return None
+                response_text = response.json().get('response', '')
+        
+        except Exception as e:
+            self.logger.warning(f"⚠️  Batched description request failed: {e}")
+            return None
+        
+        parsed = self._parse_llm_response(response_text)
+        if not parsed or not isinstance(parsed.get('descriptions'), list):
+            self.logger.warning("⚠️  Batched description response could not be parsed")
+            return None
+        
+        descriptions = {}
+        for entry in parsed['descriptions']:
+            if isinstance(entry, dict) and entry.get('repo_name'):
+                summary = self._clean_description(str(entry.get('summary') or ''))
+                if summary:
+                    descriptions[entry['repo_name']] = summary
+        
+        return descriptions
+    
     def _generate_description(self, repo_info: Dict[str, Any]) -> Optional[str]:
         """
         Generate description for a single repository.
@@ -264,19 +428,18 @@ Output: Plain text, 1–2 sentences."""
                 description = self.llm_client.generate_completion(prompt)
             else:
                 # Fallback to Ollama
-                import requests
-                
                 payload = {
                     "model": self.model_name,
                     "prompt": prompt,
                     "stream": False,
+                    "keep_alive": self.keep_alive,
                     "options": {
                         "temperature": 0.3,
-                        "max_tokens": 150  # Keep it short
+                        "num_predict": 150  # Keep it short
                     }
                 }
                 
-                response = requests.post(self.api_url, json=payload, timeout=30)
+                response = self.session.post(self.api_url, json=payload, timeout=(3, 30))
                 
                 if response.status_code == 200:
                     result = response.json()
@@ -284,20 +447,73 @@ Output: Plain text, 1–2 sentences."""
                 else:
                     return None
             
-            # Clean up the description
-            if description:
-                # Remove any markdown formatting
-                description = description.replace('**', '').replace('*', '').replace('`', '')
-                # Remove extra whitespace
-                description = ' '.join(description.split())
-                return description
-            
-            return None
+            return self._clean_description(description)
             
         except Exception as e:
             self.logger.warning(f"⚠️  Description generation failed for {repo_info['repo_name']}: {e}")
             return None
     
+    def _clean_description(self, description: Optional[str]) -> Optional[str]:
+        """Strip markdown formatting and extra whitespace from a generated description."""
+        if not description:
+            return None
+        
+        # Remove any markdown formatting
+        description = description.translate(_MD_STRIP)
+        # Remove extra whitespace
+        description = ' '.join(description.split())
+        return description or None
+    
+    async def _generate_descriptions_async(self, repositories: List[Dict[str, Any]]) -> List[Any]:
+        """Send all description prompts concurrently and gather the raw results."""
+        if self.provider != 'together_ai' and OLLAMA_AVAILABLE:
+            client = ollama.AsyncClient(host=f"http://{self.ollama_host}:11434")
+            tasks = [
+                client.generate(
+                    model=self.model_name,
+                    prompt=self._create_description_prompt(repo),
+                    options={
+                        "temperature": 0.3,
+                        "num_predict": 150  # Keep it short
+                    },
+                    stream=False,
+                    keep_alive=self.keep_alive
+                )
+                for repo in repositories
+            ]
+        else:
+            # Together AI client (and Ollama without the ollama package) is synchronous
+            tasks = [asyncio.to_thread(self._generate_description, repo) for repo in repositories]
+        
+        return await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _generate_descriptions(self, repositories: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Generate descriptions for several repositories in parallel.
+        
+        Args:
+            repositories: List of repository information
+            
+        Returns:
+            List of generated descriptions (None where generation failed), in input order
+        """
+        if not repositories:
+            return []
+        
+        results = asyncio.run(self._generate_descriptions_async(repositories))
+        
+        descriptions = []
+        for repo, result in zip(repositories, results):
+            if isinstance(result, Exception):
+                self.logger.warning(f"⚠️  Description generation failed for {repo['repo_name']}: {result}")
+                descriptions.append(None)
+            elif isinstance(result, str) or result is None:
+                descriptions.append(result)
+            else:
+                descriptions.append(self._clean_description(result['response']))
+        
+        return descriptions
+    
     def _load_github_data(self) -> Optional[Dict[str, Any]]:
         """
         Load GitHub trending data from the most recent file.
@@ -309,16 +525,14 @@ Output: Plain text, 1–2 sentences."""
             data_dir = Path(self.config_loader.get_data_paths()['raw'])
             github_path = data_dir / 'github_trending.json'
             
-            if not github_path.exists():
-                self.logger.error("No GitHub trending data file found")
-                return None
-            
-            with open(github_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(github_path)
             
             self.logger.info(f"Loaded GitHub data from: {github_path}")
             return data
             
+        except FileNotFoundError:
+            self.logger.error("No GitHub trending data file found")
+            return None
         except Exception as e:
             self.logger.error(f"Failed to load GitHub data: {e}")
             return None
@@ -350,8 +564,8 @@ Output: Plain text, 1–2 sentences."""
             # Add README preview if available
             if repo.get('status') == 'success' and repo.get('readme_content'):
                 readme_text = str(repo['readme_content'])
-                # Get first 100 words (approximate)
-                words = readme_text.split()[:100]
+                # Get first 100 words (approximate) from a bounded prefix
+                words = readme_text[:_README_PREVIEW_CHARS].split(maxsplit=100)[:100]
                 repo_info['readme_preview'] = ' '.join(words)
             
             repo_data_for_llm.append(repo_info)
@@ -374,18 +588,18 @@ Output: Plain text, 1–2 sentences."""
         if llm_ranking and llm_ranking.get('rankings'):
             self.logger.info("🎯 Using LLM ranking for repository order")
             # Use LLM ranking order
+            by_name = {r['repo_name']: r for r in repositories}
             ranked_repos = []
+            seen = set()
             for ranking in llm_ranking['rankings']:
-                repo_name = ranking['repo_name']
-                # Find the repo data
-                original_repo = next((r for r in repositories if r['repo_name'] == repo_name), None)
-                if original_repo:
+                repo_name = ranking.get('repo_name')
+                original_repo = by_name.get(repo_name)
+                if original_repo and repo_name not in seen:
                     ranked_repos.append(original_repo)
+                    seen.add(repo_name)
             
             # Add any repos that weren't in the LLM ranking
-            for repo in repositories:
-                if repo not in ranked_repos:
-                    ranked_repos.append(repo)
+            ranked_repos.extend(r for name, r in by_name.items() if name not in seen)
                     
             repositories_to_process = ranked_repos[:5]  # Top 5 for newsletter
             ranking_source = "LLM"
@@ -397,18 +611,36 @@ Output: Plain text, 1–2 sentences."""
         
         self.logger.info(f"📋 Processing top {len(repositories_to_process)} repositories ({ranking_source} ranking)")
         
-        # Generate descriptions for newsletter
+        # Use the summaries the ranking call already produced; only describe the
+        # remaining repositories, in one batched request with concurrent
+        # per-repository prompts as the fallback
         newsletter_repos = []
+        ranked_summaries = {}
+        if llm_ranking and llm_ranking.get('rankings'):
+            for ranking in llm_ranking['rankings']:
+                summary = self._clean_description(str(ranking.get('summary') or ''))
+                if summary and ranking.get('repo_name'):
+                    ranked_summaries[ranking['repo_name']] = summary
+        
+        missing = [r for r in repositories_to_process if r['repo_name'] not in ranked_summaries]
+        if missing:
+            self.logger.info(f"📝 Generating descriptions for {len(missing)} repositories without a ranking summary")
+            batched = self._generate_batched_descriptions(missing)
+            if batched:
+                ranked_summaries.update(batched)
+            else:
+                for repo, summary in zip(missing, self._generate_descriptions(missing)):
+                    if summary:
+                        ranked_summaries[repo['repo_name']] = summary
         
-        for i, repo in enumerate(repositories_to_process, 1):
+        summaries = [ranked_summaries.get(repo['repo_name']) for repo in repositories_to_process]
+        
+        for i, (repo, summary) in enumerate(zip(repositories_to_process, summaries), 1):
             self.logger.info(f"📝 Processing {repo['repo_name']} ({i}/{len(repositories_to_process)})")
             
-            # Try to generate description
-            summary = self._generate_description(repo)
-            
             if summary:
                 repo_info = {
-                    "rank": i,
+                    "rank": len(newsletter_repos) + 1,
                     "repo_name": repo['repo_name'],
                     "primary_language": repo.get('primary_language', ''),
                     "stars": repo.get('stars', 0),
@@ -419,9 +651,6 @@ Output: Plain text, 1–2 sentences."""
                 }
                 newsletter_repos.append(repo_info)
                 self.logger.info(f"   ✅ Generated: {summary[:80]}...")
-                
-                # Stop after first success for now (as per research notebook)
-                break
             else:
                 self.logger.warning(f"   ❌ Failed to generate description for {repo['repo_name']}")
         
@@ -446,6 +675,12 @@ Output: Plain text, 1–2 sentences."""
         
         return newsletter_repos
     
+    def _build_fallback(self, generated_at: datetime) -> Dict[str, Any]:
+        """Build a fresh fallback newsletter payload."""
+        fallback_data = copy.deepcopy(_FALLBACK_TEMPLATE)
+        fallback_data['metadata']['generated_at'] = generated_at.isoformat()
+        return fallback_data
+    
     def process(self) -> Dict[str, Any]:
         """
         Process GitHub trending repositories for newsletter integration.
@@ -456,35 +691,14 @@ Output: Plain text, 1–2 sentences."""
         try:
             self.logger.info("🚀 Starting GitHub trending processing")
             
+            # Single timestamp for everything this run writes
+            now = datetime.now()
+            
             # Load GitHub trending data
             github_data = self._load_github_data()
             if not github_data:
                 self.logger.warning("⚠️  No GitHub trending data available, using fallback")
-                # Create fallback data structure
-                fallback_data = {
-                    "metadata": {
-                        "title": "Trending GitHub Repositories",
-                        "subtitle": "Top repositories from the past 24 hours",
-                        "generated_at": datetime.now().isoformat(),
-                        "ranking_source": "Fallback",
-                        "total_repositories": 1,
-                        "source_data": {
-                            "total_fetched": 0,
-                            "total_filtered": 0,
-                            "total_with_readme": 0
-                        }
-                    },
-                    "repositories": [{
-                        "rank": 1,
-                        "repo_name": "bahamas10/ysap",
-                        "primary_language": "Shell",
-                        "stars": 642,
-                        "github_url": "https://github.com/bahamas10/ysap",
-                        "original_description": "You Suck at Programming - A series on programming (actually just bash scripting) on youtube, tiktok and instagram hosted by Dave Eddy.",
-                        "summary": "Our content pipeline encountered technical difficulties. We're working to restore normal service and will have fresh trending repositories for you soon. Please come back tomorrow!",
-                        "status": "fallback"
-                    }]
-                }
+                fallback_data = self._build_fallback(now)
                 
                 # Save fallback data
                 self._save_processed_data(fallback_data)
@@ -500,31 +714,7 @@ Output: Plain text, 1–2 sentences."""
             repositories = self._prepare_repositories_for_processing(github_data)
             if not repositories:
                 self.logger.warning("⚠️  No repositories found in GitHub data, using fallback")
-                # Create fallback data structure
-                fallback_data = {
-                    "metadata": {
-                        "title": "Trending GitHub Repositories",
-                        "subtitle": "Top repositories from the past 24 hours",
-                        "generated_at": datetime.now().isoformat(),
-                        "ranking_source": "Fallback",
-                        "total_repositories": 1,
-                        "source_data": {
-                            "total_fetched": 0,
-                            "total_filtered": 0,
-                            "total_with_readme": 0
-                        }
-                    },
-                    "repositories": [{
-                        "rank": 1,
-                        "repo_name": "bahamas10/ysap",
-                        "primary_language": "Shell",
-                        "stars": 642,
-                        "github_url": "https://github.com/bahamas10/ysap",
-                        "original_description": "You Suck at Programming - A series on programming (actually just bash scripting) on youtube, tiktok and instagram hosted by Dave Eddy.",
-                        "summary": "Our content pipeline encountered technical difficulties. We're working to restore normal service and will have fresh trending repositories for you soon. Please come back tomorrow!",
-                        "status": "fallback"
-                    }]
-                }
+                fallback_data = self._build_fallback(now)
                 
                 # Save fallback data
                 self._save_processed_data(fallback_data)
@@ -541,19 +731,24 @@ Output: Plain text, 1–2 sentences."""
             # Get LLM ranking for top repositories
             top_repos = repositories[:10]  # Top 10 for ranking
             llm_ranking = None
+            ranking_threshold = self.config.get('processing', {}).get('ranking_threshold', 5)
             
-            try:
-                llm_response = self._get_llm_ranking(top_repos)
-                if llm_response:
-                    llm_ranking = self._parse_llm_response(llm_response)
-                    if llm_ranking:
-                        self.logger.info("✅ LLM ranking successful")
+            if len(repositories) <= ranking_threshold:
+                # Every repository makes the newsletter; ranking would only reorder them
+                self.logger.info(f"⏭️  Skipping LLM ranking: only {len(repositories)} repositories (threshold {ranking_threshold})")
+            else:
+                try:
+                    llm_response = self._get_llm_ranking(top_repos)
+                    if llm_response:
+                        llm_ranking = self._parse_llm_response(llm_response)
+                        if llm_ranking:
+                            self.logger.info("✅ LLM ranking successful")
+                        else:
+                            self.logger.warning("⚠️  LLM ranking parsing failed")
                     else:
-                        self.logger.warning("⚠️  LLM ranking parsing failed")
-                else:
-                    self.logger.warning("⚠️  LLM ranking request failed")
-            except Exception as e:
-                self.logger.warning(f"⚠️  LLM ranking error: {e}")
+                        self.logger.warning("⚠️  LLM ranking request failed")
+                except Exception as e:
+                    self.logger.warning(f"⚠️  LLM ranking error: {e}")
             
             # Process repositories for newsletter
             newsletter_repos = self._process_repositories_for_newsletter(repositories, llm_ranking)
@@ -563,7 +758,7 @@ Output: Plain text, 1–2 sentences."""
                 "metadata": {
                     "title": "Trending GitHub Repositories",
                     "subtitle": "Top repositories from the past 24 hours",
-                    "generated_at": datetime.now().isoformat(),
+                    "generated_at": now.isoformat(),
                     "ranking_source": "LLM" if llm_ranking else "API",
                     "total_repositories": len(newsletter_repos),
                     "source_data": {
@@ -607,16 +802,16 @@ Output: Plain text, 1–2 sentences."""
             str: Path to saved file or None if failed
         """
         try:
-            # Create processed directory (run-scoped)
+            # Processed directory (run-scoped; created by ConfigLoader)
             processed_dir = Path(self.config_loader.get_data_paths()['processed'])
-            processed_dir.mkdir(parents=True, exist_ok=True)
             
             # Use fixed filename
             output_path = processed_dir / 'github_trending.json'
             
-            # Save data
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write to a temp file and rename so readers never see a partial file
+            tmp_path = output_path.with_suffix('.tmp')
+            dump_json(data, tmp_path)
+            os.replace(tmp_path, output_path)
             
             self.logger.info(f"💾 GitHub trending processed data saved to: {output_path}")
             return str(output_path)
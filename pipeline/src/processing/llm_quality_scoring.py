@@ -7,22 +7,95 @@ for newsletter curation purposes.
 
 import json
 import time
+import hashlib
+import asyncio
 import logging
 import os
 import re
 from pathlib import Path
 from datetime import datetime
-from collections import defaultdict
-from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter
+from typing import Dict, List, Any, Optional, Tuple, Callable
 from tqdm import tqdm
+import requests
+from requests.adapters import HTTPAdapter
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.utils.logger import get_logger
-from src.utils.config_loader import ConfigLoader
+from src.utils.config_loader import ConfigLoader, resolve_pipeline_path
 from src.utils.together_client import create_together_client
+from src.utils.json_utils import load_json, loads_json, dump_json, dumps_json
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import fastjsonschema
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+
+# Patterns used by _clean_text, compiled once at import
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s\-.,!?:;()]')
+
+# Per-criterion score fields returned by the LLM analysis
+_SCORE_FIELDS = ('technical_depth', 'news_value', 'clarity_readability',
+                 'impact_relevance', 'originality', 'overall_quality')
+
+# Schema the LLM analysis must satisfy: every criterion score present and numeric
+_ANALYSIS_SCHEMA = {
+    'type': 'object',
+    'required': list(_SCORE_FIELDS),
+    'properties': {field: {'type': 'number'} for field in _SCORE_FIELDS}
+}
+
+# Static parts of the quality analysis prompt around the per-article title/content
+_QUALITY_PROMPT_PREFIX = """You are an expert content curator for a high-quality tech newsletter. Analyze this article and provide a comprehensive quality assessment.
+
+ARTICLE DETAILS:
+"""
+
+_QUALITY_PROMPT_SUFFIX = """
+EVALUATION CRITERIA:
+1. **Technical Depth** (1-100): How technically informative and detailed is the content?
+2. **News Value** (1-100): How newsworthy and timely is this information?
+3. **Clarity & Readability** (1-100): How clear, well-structured, and readable is the writing?
+4. **Impact & Relevance** (1-100): How significant is this for tech professionals and enthusiasts?
+5. **Originality** (1-100): How original and insightful is the content vs generic information?
+
+SCORING GUIDELINES:
+- 90-100: Exceptional quality, must-read content
+- 80-89: High quality, very valuable
+- 70-79: Good quality, worth reading
+- 60-69: Acceptable quality, decent content
+- 50-59: Below average, questionable value
+- 1-49: Poor quality, not suitable
+
+Respond ONLY with a JSON object in this exact format:
+
+{
+    "technical_depth": <1-100>,
+    "news_value": <1-100>,
+    "clarity_readability": <1-100>,
+    "impact_relevance": <1-100>,
+    "originality": <1-100>,
+    "overall_quality": <1-100>,
+    "content_type": "<news|analysis|tutorial|announcement|opinion|other>",
+    "tech_relevance": "<high|medium|low>",
+    "target_audience": "<beginners|intermediate|advanced|general>",
+    "key_strengths": ["<strength1>", "<strength2>"],
+    "key_weaknesses": ["<weakness1>", "<weakness2>"],
+    "reasoning": "<brief explanation of overall assessment>"
+}
+
+Focus on content that would be valuable for tech professionals, entrepreneurs, and tech enthusiasts. Be strict with quality standards."""
 
 
 class LLMQualityScoringStep:
@@ -50,6 +123,7 @@ class LLMQualityScoringStep:
         
         if self.provider == 'together_ai':
             self.llm_client = create_together_client(self.llm_config['together_ai'])
+            self.model = self.llm_config['together_ai'].get('model', '')
             # Set attributes for compatibility
             self.temperature = self.llm_config['together_ai'].get('temperature', 0.3)
             self.max_tokens = self.llm_config['together_ai'].get('max_tokens', 2000)
@@ -62,11 +136,56 @@ class LLMQualityScoringStep:
             self.seed = self.llm_config['ollama'].get('seed', 42)
             self.max_tokens = self.llm_config['ollama'].get('max_tokens', 2000)
             self.max_retries = self.llm_config['ollama'].get('max_retries', 3)
+            # Keep the model loaded between articles
+            self.keep_alive = self.llm_config['ollama'].get('keep_alive', -1)
+            # Context sized for the prompt plus truncated content; output is a small JSON object
+            scoring_llm_config = self.llm_config.get('quality_scoring', {})
+            self.num_ctx = scoring_llm_config.get('num_ctx', 4096)
+            self.num_predict = scoring_llm_config.get('num_predict', 400)
+        
+        # Number of articles scored concurrently. For Ollama this defaults to its parallel slots
+        # (OLLAMA_NUM_PARALLEL): extra requests would only queue server-side and eat into timeouts
+        if self.provider == 'together_ai':
+            default_concurrency = 16
+        else:
+            default_concurrency = self.llm_config['ollama'].get('num_parallel', 4)
+        self.max_concurrency = self.llm_config.get('max_concurrency', default_concurrency)
+        
+        # Per-read timeout: the analysis is streamed, so this bounds stalls rather than total time
+        self.request_timeout = self.llm_config.get('quality_scoring', {}).get('timeout_seconds', 120)
+        
+        # Pooled keep-alive session for synchronous Ollama requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.max_concurrency, pool_maxsize=self.max_concurrency, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         # Quality scoring configuration
         self.scoring_config = self.config['scoring']
         self.min_quality_score = self.scoring_config.get('min_quality_score', 60)
         
+        # Append-only checkpoint of completed analyses, so an interrupted run can resume
+        self.checkpoint_enabled = self.config['output'].get('checkpoint', True)
+        
+        # Analysis validator, compiled once
+        self._validator = fastjsonschema.compile(_ANALYSIS_SCHEMA) if FASTJSONSCHEMA_AVAILABLE else None
+        
+        # Persistent analysis cache shared across runs: one small file per entry, so a run
+        # only reads the entries it needs; entries unused for max_age_days are pruned
+        cache_config = self.config.get('cache', {})
+        self.cache_enabled = cache_config.get('enabled', True)
+        self.cache_dir = resolve_pipeline_path(cache_config.get('cache_dir', 'data/cache')) / 'quality_scores'
+        self.cache_max_age_days = cache_config.get('max_age_days', 30)
+        
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+    
+    def __del__(self):
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
+    
     def _load_input_data(self) -> List[Dict[str, Any]]:
         """Load input data from ad detection step."""
         import glob
@@ -83,8 +202,7 @@ class LLMQualityScoringStep:
                 raise FileNotFoundError(f"Input file not found: {fixed_input}")
             self.logger.info(f"Loading input data from: {fixed_input}")
             
-            with open(fixed_input, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(fixed_input)
             
             articles = data.get('articles', [])
             self.logger.info(f"Loaded {len(articles)} articles from input file")
@@ -109,8 +227,7 @@ class LLMQualityScoringStep:
             output_path = self.data_paths['processed']
             filepath = os.path.join(output_path, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            dump_json(output_data, filepath)
             
             self.logger.info(f"Saved output data to: {filepath}")
             return filepath
@@ -119,19 +236,115 @@ class LLMQualityScoringStep:
             self.logger.error(f"Failed to save output data: {e}")
             raise
     
+    def _get_checkpoint_path(self) -> str:
+        """Path of the JSONL checkpoint next to the step output."""
+        filename_prefix = self.config['output']['filename_prefix']
+        return os.path.join(self.data_paths['processed'], f"{filename_prefix}.partial.jsonl")
+    
+    def _load_checkpoint(self, articles: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+        """Load analyses checkpointed by an interrupted run (article index -> LLM result)."""
+        checkpoint_path = self._get_checkpoint_path()
+        if not os.path.exists(checkpoint_path):
+            return {}
+        
+        results = {}
+        try:
+            with open(checkpoint_path, 'rb') as f:
+                for line in f:
+                    try:
+                        record = loads_json(line)
+                    except ValueError:
+                        continue  # Torn last line from a crash
+                    
+                    i = record.get('i')
+                    # Only trust records that still line up with the same input article
+                    if isinstance(i, int) and 0 <= i < len(articles) and articles[i].get('title', '') == record.get('title'):
+                        results[i] = {'success': True, 'analysis': record['analysis'], 'attempt': record.get('attempt', 1)}
+        except OSError as e:
+            self.logger.warning(f"⚠️ Ignoring unreadable checkpoint {checkpoint_path}: {e}")
+            return {}
+        
+        return results
+    
+    def _get_score_cache_key(self, article: Dict[str, Any]) -> str:
+        """Cache key: provider, model, sampling/context settings and the full prompt sent to the LLM."""
+        num_ctx = self.num_ctx if self.provider != 'together_ai' else None
+        return hashlib.blake2b(
+            f"{self.provider}|{self.model}|{self.temperature}|{num_ctx}|"
+            f"{self._create_quality_analysis_prompt(article)}".encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+    
+    def _get_score_cache_path(self, key: str) -> Path:
+        """Path of a single cached analysis, sharded by key prefix."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def _lookup_score_cache(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis for a key, or None."""
+        cache_path = self._get_score_cache_path(key)
+        try:
+            cached = load_json(cache_path)
+            # Refresh the entry's age so analyses still in use are not pruned
+            os.utime(cache_path)
+            return cached
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            self.logger.warning(f"⚠️ Ignoring unreadable quality score cache entry {cache_path}: {e}")
+            return None
+    
+    def _store_score_cache(self, key: str, analysis: Dict[str, Any]) -> None:
+        """Write one cached analysis atomically, so a crash never leaves a truncated entry."""
+        cache_path = self._get_score_cache_path(key)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            dump_json(analysis, tmp_path, indent=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to write quality score cache entry {cache_path}: {e}")
+    
+    def _prune_score_cache(self) -> None:
+        """Delete cached analyses not used within max_age_days."""
+        if not self.cache_max_age_days or not self.cache_dir.exists():
+            return
+        
+        cutoff = time.time() - self.cache_max_age_days * 86400
+        pruned = 0
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        pruned += 1
+                except OSError:
+                    pass
+        
+        if pruned:
+            self.logger.info(f"🧹 Pruned {pruned} quality score cache entries unused for {self.cache_max_age_days} days")
+    
+    def _get_cleaned_content(self, article: Dict[str, Any]) -> str:
+        """Cleaned article content, reusing the copy stashed by execute() when present."""
+        cleaned = article.get('_cleaned')
+        if cleaned is None:
+            cleaned = self._clean_text(article.get('content', ''))
+        return cleaned
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for better LLM processing."""
         if not text:
             return ""
             
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_PATTERN.sub('', text)
         
         # Normalize whitespace
         text = ' '.join(text.split())
         
         # Remove excessive punctuation but keep common punctuation
-        text = re.sub(r'[^\w\s\-.,!?:;()]', '', text)
+        text = _PUNCTUATION_PATTERN.sub('', text)
         
         return text.strip()
     
@@ -159,50 +372,12 @@ class LLMQualityScoringStep:
     def _create_quality_analysis_prompt(self, article: Dict[str, Any]) -> str:
         """Create a sophisticated prompt for content quality analysis."""
         title = self._clean_text(article.get('title', ''))
-        content = self._clean_text(article.get('content', ''))
+        content = self._get_cleaned_content(article)
         
         # Truncate content for LLM processing
         content_for_analysis = self._truncate_content(content, self.max_tokens)
         
-        prompt = f"""You are an expert content curator for a high-quality tech newsletter. Analyze this article and provide a comprehensive quality assessment.
-
-ARTICLE DETAILS:
-Title: {title}
-Content: {content_for_analysis}
-
-EVALUATION CRITERIA:
-1. **Technical Depth** (1-100): How technically informative and detailed is the content?
-2. **News Value** (1-100): How newsworthy and timely is this information?
-3. **Clarity & Readability** (1-100): How clear, well-structured, and readable is the writing?
-4. **Impact & Relevance** (1-100): How significant is this for tech professionals and enthusiasts?
-5. **Originality** (1-100): How original and insightful is the content vs generic information?
-
-SCORING GUIDELINES:
-- 90-100: Exceptional quality, must-read content
-- 80-89: High quality, very valuable
-- 70-79: Good quality, worth reading
-- 60-69: Acceptable quality, decent content
-- 50-59: Below average, questionable value
-- 1-49: Poor quality, not suitable
-
-Respond ONLY with a JSON object in this exact format:
-
-{{
-    "technical_depth": <1-100>,
-    "news_value": <1-100>,
-    "clarity_readability": <1-100>,
-    "impact_relevance": <1-100>,
-    "originality": <1-100>,
-    "overall_quality": <1-100>,
-    "content_type": "<news|analysis|tutorial|announcement|opinion|other>",
-    "tech_relevance": "<high|medium|low>",
-    "target_audience": "<beginners|intermediate|advanced|general>",
-    "key_strengths": ["<strength1>", "<strength2>"],
-    "key_weaknesses": ["<weakness1>", "<weakness2>"],
-    "reasoning": "<brief explanation of overall assessment>"
-}}
-
-Focus on content that would be valuable for tech professionals, entrepreneurs, and tech enthusiasts. Be strict with quality standards."""
+        prompt = f"{_QUALITY_PROMPT_PREFIX}Title: {title}\nContent: {content_for_analysis}\n{_QUALITY_PROMPT_SUFFIX}"
 
         return prompt
     
@@ -215,10 +390,10 @@ Focus on content that would be valuable for tech professionals, entrepreneurs, a
             try:
                 self.logger.debug("Making Together AI request for quality analysis")
                 
-                # Add a small progress indicator for LLM request
-                with tqdm(total=1, desc="🤖 Together AI processing", leave=False, bar_format="{desc}: {elapsed}") as llm_progress:
-                    analysis = self.llm_client.generate_json_completion(prompt)
-                    llm_progress.update(1)
+                request_start = time.perf_counter()
+                analysis = self.llm_client.generate_json_completion(prompt)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug(f"Together AI response received in {time.perf_counter() - request_start:.2f}s")
                 
                 # Return in the same format as Ollama for consistency
                 return {
@@ -233,55 +408,42 @@ Focus on content that would be valuable for tech professionals, entrepreneurs, a
                 raise e
         else:
             # Fallback to Ollama
-            payload = {
-                "model": self.model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": self.temperature,
-                    "seed": self.seed
-                }
-            }
+            payload = self._build_ollama_payload(prompt)
             
             for attempt in range(self.max_retries):
                 try:
-                    self.logger.debug(f"Making Ollama request (attempt {attempt + 1}/{self.max_retries})")
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Making Ollama request (attempt {attempt + 1}/{self.max_retries})")
                     
-                    # Add a small progress indicator for LLM request
-                    with tqdm(total=1, desc="🤖 Ollama processing", leave=False, bar_format="{desc}: {elapsed}") as llm_progress:
-                        import requests
-                        response = requests.post(
-                            f"{self.url}/api/generate",
-                            json=payload,
-                            timeout=120
-                        )
-                        llm_progress.update(1)
+                    request_start = time.perf_counter()
+                    response = self.session.post(
+                        f"{self.url}/api/generate",
+                        json=payload,
+                        timeout=(10, self.request_timeout),
+                        stream=True
+                    )
                     
                     if response.status_code == 200:
-                        result = response.json()
-                        response_text = result.get('response', '')
+                        # Read the stream only until the analysis object closes
+                        parts = []
+                        stream_state = {'depth': 0, 'opened': False, 'in_string': False, 'escaped': False}
+                        with response:
+                            for line in response.iter_lines():
+                                if self._accumulate_stream_chunk(line, parts, stream_state):
+                                    break
+                        response_text = ''.join(parts)
+                        if self.logger.isEnabledFor(logging.DEBUG):
+                            self.logger.debug(f"Ollama response received in {time.perf_counter() - request_start:.2f}s")
                         
                         # Extract JSON from response
                         try:
-                            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-                            if json_match:
-                                analysis = json.loads(json_match.group())
-                                
-                                # Validate required fields
-                                required_fields = ['technical_depth', 'news_value', 'clarity_readability', 
-                                                 'impact_relevance', 'originality', 'overall_quality']
-                                
-                                if all(field in analysis for field in required_fields):
-                                    return {
-                                        'success': True,
-                                        'analysis': analysis,
-                                        'raw_response': response_text,
-                                        'attempt': attempt + 1
-                                    }
-                                else:
-                                    raise ValueError(f"Missing required fields in analysis: {analysis}")
-                            else:
-                                raise ValueError("No JSON found in response")
+                            analysis = self._parse_analysis_response(response_text)
+                            return {
+                                'success': True,
+                                'analysis': analysis,
+                                'raw_response': response_text,
+                                'attempt': attempt + 1
+                            }
                                 
                         except (json.JSONDecodeError, ValueError) as e:
                             if attempt < self.max_retries - 1:
@@ -304,21 +466,185 @@ Focus on content that would be valuable for tech professionals, entrepreneurs, a
             # If we get here, all retries failed
             raise Exception(f"All {self.max_retries} attempts failed")
     
+    def _build_ollama_payload(self, prompt: str) -> Dict[str, Any]:
+        """Build the Ollama generate request for a quality analysis prompt."""
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "keep_alive": self.keep_alive,
+            "options": {
+                "temperature": self.temperature,
+                "seed": self.seed,
+                "num_ctx": self.num_ctx,
+                "num_predict": self.num_predict,
+                # Stop as soon as the analysis object closes (the schema has no nested objects)
+                "stop": ["}\n"]
+            }
+        }
+    
+    def _accumulate_stream_chunk(self, line: bytes, parts: List[str], state: Dict[str, Any]) -> bool:
+        """
+        Append one streamed Ollama chunk to parts.
+        
+        Tracks brace depth (ignoring braces inside JSON strings) across chunks in state.
+        
+        Returns:
+            True once the analysis object has closed or the stream is done
+        """
+        if not line.strip():
+            return False
+        
+        chunk = loads_json(line)
+        fragment = chunk.get('response', '')
+        parts.append(fragment)
+        
+        for char in fragment:
+            if state['in_string']:
+                if state['escaped']:
+                    state['escaped'] = False
+                elif char == '\\':
+                    state['escaped'] = True
+                elif char == '"':
+                    state['in_string'] = False
+            elif char == '"':
+                state['in_string'] = state['opened']
+            elif char == '{':
+                state['depth'] += 1
+                state['opened'] = True
+            elif char == '}' and state['depth']:
+                state['depth'] -= 1
+        
+        return chunk.get('done', False) or (state['opened'] and state['depth'] == 0)
+    
+    def _parse_analysis_response(self, response_text: str) -> Dict[str, Any]:
+        """Extract and validate the analysis JSON from an Ollama response."""
+        # The stop sequence swallows the final closing brace; restore it
+        if response_text.count('{') > response_text.count('}'):
+            response_text = response_text.rstrip() + '}'
+        
+        # Outermost braces, same span the greedy r'\{.*\}' match used to take
+        start = response_text.find('{')
+        end = response_text.rfind('}') + 1
+        if start == -1 or end <= start:
+            raise ValueError("No JSON found in response")
+        
+        analysis = loads_json(response_text[start:end])
+        if not isinstance(analysis, dict):
+            raise ValueError(f"Analysis is not a JSON object: {analysis}")
+        
+        # Validate required fields
+        if self._validator is not None:
+            try:
+                self._validator(analysis)
+            except fastjsonschema.JsonSchemaException as e:
+                raise ValueError(f"Invalid analysis ({e.message}): {analysis}")
+        elif not all(field in analysis for field in _SCORE_FIELDS):
+            raise ValueError(f"Missing required fields in analysis: {analysis}")
+        
+        return analysis
+    
+    async def _analyze_content_with_llm_async(self, article: Dict[str, Any], session, sem: asyncio.Semaphore) -> Dict[str, Any]:
+        """Analyze content using LLM with retry logic, bounded by the concurrency semaphore."""
+        async with sem:
+            if session is None:
+                # Together AI client (and Ollama without aiohttp) is synchronous
+                return await asyncio.to_thread(self._analyze_content_with_llm, article)
+            
+            payload = self._build_ollama_payload(self._create_quality_analysis_prompt(article))
+            
+            for attempt in range(self.max_retries):
+                try:
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(f"Making Ollama request (attempt {attempt + 1}/{self.max_retries})")
+                    
+                    parts = []
+                    stream_state = {'depth': 0, 'opened': False, 'in_string': False, 'escaped': False}
+                    async with session.post(f"{self.url}/api/generate", json=payload) as response:
+                        if response.status != 200:
+                            raise Exception(f"HTTP {response.status}: {await response.text()}")
+                        # Read the stream only until the analysis object closes
+                        async for line in response.content:
+                            if self._accumulate_stream_chunk(line, parts, stream_state):
+                                break
+                    
+                    response_text = ''.join(parts)
+                    analysis = self._parse_analysis_response(response_text)
+                    return {
+                        'success': True,
+                        'analysis': analysis,
+                        'raw_response': response_text,
+                        'attempt': attempt + 1
+                    }
+                    
+                except Exception as e:
+                    if attempt < self.max_retries - 1:
+                        self.logger.warning(f"LLM request failed (attempt {attempt + 1}): {e}")
+                        # Brief delay for parsing errors, longer for network issues
+                        await asyncio.sleep(1 if isinstance(e, ValueError) else 2)
+                        continue
+                    raise
+            
+            raise Exception(f"All {self.max_retries} attempts failed")
+    
+    async def _execute_async(self, articles: List[Dict[str, Any]],
+                             on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None) -> List[Any]:
+        """
+        Score all articles concurrently.
+        
+        Args:
+            articles: Articles to score
+            on_result: Optional callback (position, result) for each successful analysis as it completes
+            
+        Returns:
+            Results (or exceptions) in input order
+        """
+        sem = asyncio.Semaphore(self.max_concurrency)
+        counts = {'llm_ok': 0, 'llm_err': 0}
+        
+        progress_bar = tqdm(
+            total=len(articles),
+            desc="🔍 Analyzing articles with LLM",
+            unit="article",
+            mininterval=0.5,
+            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]"
+        )
+        
+        async def run(position, article, session):
+            try:
+                result = await self._analyze_content_with_llm_async(article, session, sem)
+                counts['llm_ok' if result.get('success') else 'llm_err'] += 1
+                if on_result is not None and result.get('success'):
+                    on_result(position, result)
+                return result
+            except Exception:
+                counts['llm_err'] += 1
+                raise
+            finally:
+                done = counts['llm_ok'] + counts['llm_err']
+                if done % 8 == 0 or done == len(articles):
+                    progress_bar.set_postfix_str(f"ok={counts['llm_ok']} err={counts['llm_err']}", refresh=False)
+                progress_bar.update(1)
+        
+        try:
+            if self.provider != 'together_ai' and AIOHTTP_AVAILABLE:
+                connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+                timeout = aiohttp.ClientTimeout(total=None, sock_connect=10, sock_read=self.request_timeout)
+                async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                    return await asyncio.gather(*(run(p, a, session) for p, a in enumerate(articles)), return_exceptions=True)
+            return await asyncio.gather(*(run(p, a, None) for p, a in enumerate(articles)), return_exceptions=True)
+        finally:
+            progress_bar.close()
+    
     def _calculate_quality_metrics(self, analysis: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate additional quality metrics from LLM analysis."""
-        scores = {
-            'technical_depth': analysis.get('technical_depth', 0),
-            'news_value': analysis.get('news_value', 0),
-            'clarity_readability': analysis.get('clarity_readability', 0),
-            'impact_relevance': analysis.get('impact_relevance', 0),
-            'originality': analysis.get('originality', 0),
-            'overall_quality': analysis.get('overall_quality', 0)
-        }
+        values = tuple(analysis.get(field, 0) for field in _SCORE_FIELDS)
+        scores = dict(zip(_SCORE_FIELDS, values))
         
         # Calculate derived metrics
-        avg_score = sum(scores.values()) / len(scores)
-        min_score = min(scores.values())
-        max_score = max(scores.values())
+        avg_score = sum(values) / len(values)
+        min_score = min(values)
+        max_score = max(values)
         
         # Quality level classification
         if avg_score >= 85:
@@ -369,39 +695,108 @@ Focus on content that would be valuable for tech professionals, entrepreneurs, a
         filtered_articles = []
         quality_results = []
         
-        # Statistics tracking
-        quality_levels = defaultdict(int)
-        content_types = defaultdict(int)
-        tech_relevance = defaultdict(int)
+        # Statistics tracking: (quality_level, content_type, tech_relevance) per scored article
+        stats_rows = []
         
         # Initialize counters for progress tracking
         llm_success_count = 0
         llm_error_count = 0
         
-        # Create progress bar for article processing
-        progress_bar = tqdm(
-            articles, 
-            desc="🔍 Analyzing articles with LLM", 
-            unit="article",
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]"
-        )
-        
-        for i, article in enumerate(progress_bar):
+        # Clean each article's content once; the length check, cache key and prompt all reuse it
+        for article in articles:
+            article['_cleaned'] = self._clean_text(article.get('content', ''))
+        
+        # Articles without enough text can't be scored meaningfully; filter them before any LLM call
+        min_content_chars = self.scoring_config.get('min_content_chars', 300)
+        too_short = {i for i, article in enumerate(articles) if len(article['_cleaned']) < min_content_chars}
+        if too_short:
+            self.logger.info(f"✂️  Skipping LLM for {len(too_short)} articles under {min_content_chars} characters of content")
+        
+        # Resume analyses checkpointed by an interrupted run of this step
+        llm_results = [None] * len(articles)
+        resumed = self._load_checkpoint(articles) if self.checkpoint_enabled else {}
+        for i, llm_result in resumed.items():
+            llm_results[i] = llm_result
+        if resumed:
+            self.logger.info(f"♻️  Resumed {len(resumed)} analyses from checkpoint")
+        
+        # Reuse analyses cached by earlier runs; only uncached articles go to the LLM
+        pending = [i for i in range(len(articles)) if i not in too_short and i not in resumed]
+        cache_keys = {}
+        if self.cache_enabled:
+            cache_keys = {i: self._get_score_cache_key(articles[i]) for i in pending}
+            pending = []
+            for i, key in cache_keys.items():
+                cached = self._lookup_score_cache(key)
+                if cached is not None:
+                    llm_results[i] = {'success': True, 'analysis': cached, 'attempt': 0}
+                else:
+                    pending.append(i)
+            self.logger.info(f"💾 Quality score cache: {len(cache_keys) - len(pending)} hits, {len(pending)} misses")
+        
+        # Score each distinct article once (same URL, or same cleaned content); duplicates share the result
+        duplicate_of = {}
+        first_by_key = {}
+        unique_pending = []
+        for i in pending:
+            key = articles[i].get('url') or hashlib.blake2b(articles[i]['_cleaned'].encode('utf-8'), digest_size=16).hexdigest()
+            if key in first_by_key:
+                duplicate_of[i] = first_by_key[key]
+            else:
+                first_by_key[key] = i
+                unique_pending.append(i)
+        if duplicate_of:
+            self.logger.info(f"🔁 {len(duplicate_of)} duplicate articles will reuse another article's analysis")
+        pending = unique_pending
+        
+        # Score the remaining articles concurrently, then process results in input order
+        if pending:
+            checkpoint_file = open(self._get_checkpoint_path(), 'ab') if self.checkpoint_enabled else None
+            
+            def write_checkpoint(position: int, llm_result: Dict[str, Any]) -> None:
+                i = pending[position]
+                checkpoint_file.write(dumps_json({
+                    'i': i,
+                    'title': articles[i].get('title', ''),
+                    'analysis': llm_result['analysis'],
+                    'attempt': llm_result['attempt']
+                }) + b'\n')
+                checkpoint_file.flush()
+            
             try:
-                # Update progress bar with current article info
-                article_title = article.get('title', 'Unknown')[:50]
-                progress_bar.set_postfix({
-                    'current': article_title,
-                    'passed': len(passed_articles),
-                    'filtered': len(filtered_articles),
-                    'llm_ok': llm_success_count,
-                    'llm_err': llm_error_count
+                fresh_results = asyncio.run(self._execute_async(
+                    [articles[i] for i in pending],
+                    on_result=write_checkpoint if checkpoint_file else None
+                ))
+            finally:
+                if checkpoint_file:
+                    checkpoint_file.close()
+            for i, llm_result in zip(pending, fresh_results):
+                llm_results[i] = llm_result
+                if self.cache_enabled and isinstance(llm_result, dict) and llm_result.get('success'):
+                    self._store_score_cache(cache_keys[i], llm_result['analysis'])
+        
+        if self.cache_enabled:
+            self._prune_score_cache()
+        
+        for i, j in duplicate_of.items():
+            llm_results[i] = llm_results[j]
+        
+        # Don't carry the scratch copy into the saved articles
+        for article in articles:
+            article.pop('_cleaned', None)
+        
+        for i, (article, llm_result) in enumerate(zip(articles, llm_results)):
+            if i in too_short:
+                filtered_articles.append({
+                    'article': article,
+                    'reason': f"Content too short: under {min_content_chars} characters"
                 })
-                
-                self.logger.debug(f"Analyzing article {i+1}/{len(articles)}: {article_title}...")
-                
-                # Analyze content with LLM
-                llm_result = self._analyze_content_with_llm(article)
+                continue
+            
+            try:
+                if isinstance(llm_result, Exception):
+                    raise llm_result
                 
                 if llm_result['success']:
                     llm_success_count += 1
@@ -409,9 +804,11 @@ Focus on content that would be valuable for tech professionals, entrepreneurs, a
                     metrics = self._calculate_quality_metrics(analysis)
                     
                     # Track statistics
-                    quality_levels[metrics['quality_level']] += 1
-                    content_types[analysis.get('content_type', 'unknown')] += 1
-                    tech_relevance[analysis.get('tech_relevance', 'unknown')] += 1
+                    stats_rows.append((
+                        metrics['quality_level'],
+                        analysis.get('content_type', 'unknown'),
+                        analysis.get('tech_relevance', 'unknown')
+                    ))
                     
                     # Create comprehensive result
                     result = {
@@ -452,8 +849,11 @@ Focus on content that would be valuable for tech professionals, entrepreneurs, a
         
         processing_time = time.time() - start_time
         
-        # Close progress bar and show final summary
-        progress_bar.close()
+        # Count statistics once after all results are in
+        ql, ct, tr = zip(*stats_rows) if stats_rows else ((), (), ())
+        quality_levels = Counter(ql)
+        content_types = Counter(ct)
+        tech_relevance = Counter(tr)
         
         # Show final progress summary
         self.logger.info(f"📊 Final Progress Summary:")
@@ -485,8 +885,10 @@ Focus on content that would be valuable for tech professionals, entrepreneurs, a
             'quality_results': quality_results
         }
         
-        # Save to file
+        # Save to file; the checkpoint is no longer needed once the output is complete
         output_file = self._save_output_data(output_data)
+        if self.checkpoint_enabled and os.path.exists(self._get_checkpoint_path()):
+            os.remove(self._get_checkpoint_path())
         
         # Log results
         self.logger.info(f"⏱️  Processing time: {processing_time:.2f} seconds")
@@ -4,13 +4,116 @@ Newsletter generation step for the Bit-by-Bit pipeline.
 Creates clean, formatted output with pipeline visualization data.
 """
 
-import json
+import gzip
 import os
 from src.utils.logger import get_logger
+from src.utils.json_utils import load_json, dumps_json
+from collections import Counter
+from itertools import chain
 from datetime import datetime
-from typing import Dict, Any, List
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from pathlib import Path
 
+# Newsletter summary categories, in display order
+_SUMMARY_CATEGORIES = ('headlines', 'secondary', 'optional')
+
+# Data flow rows: (label, metadata key, step metadata -> (input, output, description))
+_FLOW_STEPS = (
+    ('RSS Gathering', 'rss_gathering', lambda d: (
+        0, d['articles_collected'],
+        f"Collected {d['articles_collected']} articles from {d['feeds_processed']} feeds")),
+    ('Content Filtering', 'content_filtering', lambda d: (
+        d['articles_input'], d['articles_passed'],
+        f"Filtered {d['articles_passed']}/{d['articles_input']} articles ({d['pass_rate']:.1f}% pass rate)")),
+    ('Ad Detection', 'ad_detection', lambda d: (
+        d['articles_input'], d['articles_passed'],
+        f"Removed {d['articles_filtered']} ads, kept {d['articles_passed']} articles ({d['pass_rate']:.1f}% pass rate)")),
+    ('Quality Scoring', 'quality_scoring', lambda d: (
+        d['articles_processed'], d['articles_passed'],
+        f"Scored {d['articles_processed']} articles, kept {d['articles_passed']} ({d['pass_rate']:.1f}% pass rate)")),
+    ('Deduplication', 'deduplication', lambda d: (
+        d['articles_before'], d['articles_after'],
+        f"Removed {d['duplicates_removed']} duplicates ({d['reduction_percentage']:.1f}% reduction)")),
+    ('Prioritization', 'prioritization', lambda d: (
+        d['articles_processed'], d['articles_processed'],
+        f"Categorized into {d['headlines_count']} headlines, {d['secondary_count']} secondary, {d['optional_count']} optional")),
+    ('Summarization', 'summarization', lambda d: (
+        d['articles_processed'], d['articles_processed'],
+        f"Summarized {d['articles_processed']} articles for newsletter")),
+)
+
+# Step outputs read by _collect_pipeline_metadata, in pipeline order:
+# (metadata key, filename, {output field: (path into the file, default)}); an empty path always yields the default
+_STEP_SPECS = (
+    ('content_filtering', 'filtered_content.json', {
+        'articles_input': (('metadata', 'total_articles_input'), 0),
+        'articles_passed': (('metadata', 'total_articles_passed'), 0),
+        'articles_filtered': (('metadata', 'total_articles_rejected'), 0),
+        'pass_rate': (('metadata', 'filter_pass_rate'), 0),
+        'processing_time': ((), 0),  # Not available in this file
+        'timestamp': (('metadata', 'processing_timestamp'), ''),
+    }),
+    ('ad_detection', 'ad_filtered_content.json', {
+        'articles_input': (('statistics', 'articles_input'), 0),
+        'articles_passed': (('statistics', 'articles_passed'), 0),
+        'articles_filtered': (('statistics', 'articles_filtered'), 0),
+        'pass_rate': (('statistics', 'pass_rate'), 0),
+        'ad_percentage': (('statistics', 'ad_statistics', 'ad_percentage'), 0),
+        'news_percentage': (('statistics', 'ad_statistics', 'news_percentage'), 0),
+        'processing_time': (('metadata', 'processing_time_seconds'), 0),
+        'timestamp': (('metadata', 'timestamp'), ''),
+    }),
+    ('quality_scoring', 'quality_scored_content.json', {
+        'articles_processed': (('statistics', 'articles_input'), 0),
+        'articles_passed': (('statistics', 'articles_passed'), 0),
+        'articles_filtered': (('statistics', 'articles_filtered'), 0),
+        'pass_rate': (('statistics', 'pass_rate'), 0),
+        'processing_time': (('metadata', 'processing_time_seconds'), 0),
+        'timestamp': (('metadata', 'timestamp'), ''),
+    }),
+    ('deduplication', 'deduplicated_content.json', {
+        'articles_before': (('statistics', 'articles_input'), 0),
+        'articles_after': (('statistics', 'articles_selected'), 0),
+        'duplicates_removed': (('statistics', 'total_duplicates_removed'), 0),
+        'reduction_percentage': (('statistics', 'deduplication_rate'), 0),
+        'processing_time': (('metadata', 'processing_time_seconds'), 0),
+        'timestamp': (('metadata', 'timestamp'), ''),
+    }),
+    ('prioritization', 'prioritized_content.json', {
+        'articles_processed': (('metadata', 'articles_processed'), 0),
+        'llm_success': (('metadata', 'llm_success'), False),
+        'fallback_used': (('metadata', 'fallback_used'), False),
+        'processing_time': (('metadata', 'processing_time_seconds'), 0),
+        'timestamp': (('metadata', 'timestamp'), ''),
+    }),
+    ('summarization', 'summarized_content.json', {
+        'articles_processed': (('metadata', 'articles_processed'), 0),
+        'processing_time': (('metadata', 'processing_time_seconds'), 0),
+        'llm_success_count': (('statistics', 'llm_success_count'), 0),
+        'fallback_count': (('statistics', 'fallback_count'), 0),
+        'timestamp': (('metadata', 'timestamp'), ''),
+    }),
+)
+
+# Prioritization category sizes: {output field: categorization list}
+_PRIORITIZATION_COUNTS = {
+    'headlines_count': 'headlines',
+    'secondary_count': 'secondary',
+    'optional_count': 'optional',
+}
+
+
+def _pick(data: Dict[str, Any], path: Tuple[str, ...], default: Any) -> Any:
+    """Follow path through nested dicts, returning default if any key is missing."""
+    if not path:
+        return default
+    for key in path:
+        data = data.get(key) if isinstance(data, dict) else None
+        if data is None:
+            return default
+    return data
+
+
 class NewsletterGenerationStep:
     """Generate clean newsletter output with pipeline visualization data."""
     
@@ -19,8 +122,18 @@ class NewsletterGenerationStep:
         self.step_name = "newsletter_generation"
         self.config = self.config_loader.get_step_config(self.step_name)
         self.data_paths = self.config_loader.get_data_paths()
-        self.output_dir = Path(self.data_paths['processed'])
-        self.output_dir.mkdir(exist_ok=True)
+        self.processed_dir = Path(self.data_paths['processed'])
+        if not self.processed_dir.exists():
+            self.processed_dir.mkdir(parents=True, exist_ok=True)
+        self.pretty_output = self.config.get('output', {}).get('pretty', False)
+        self.gzip_output = self.config.get('output', {}).get('gzip', False)
+        
+        # Visualization sections are optional; skipping them saves work when only content is consumed
+        newsletter_config = self.config.get('newsletter', {})
+        self.include_visualization = newsletter_config.get('include_pipeline_visualization', True)
+        self.include_quality_analysis = newsletter_config.get('include_quality_analysis', True)
+        self.include_source_analysis = newsletter_config.get('include_source_analysis', True)
+        self.include_processing_stats = newsletter_config.get('include_processing_stats', True)
         
         # Setup logging (run-scoped)
         self.logger = get_logger()
@@ -29,17 +142,25 @@ class NewsletterGenerationStep:
         """Execute the newsletter generation step."""
         self.logger.info("🚀 Starting newsletter generation step")
         
+        # One clock read keeps every timestamp in the output consistent
+        now = datetime.now()
+        now_iso = now.isoformat()
+        
         try:
-            # Load summarized content
+            # Fail fast, before any metadata scanning, when the pipeline has not produced summaries yet
             summarized_data = self._load_summarized_content()
             if not summarized_data:
-                raise Exception("No summarized content found")
+                error = "No summarized content files found" if summarized_data is None else "No summarized content found"
+                self.logger.error(f"❌ Newsletter generation failed: {error}")
+                return self._create_failure_result(error, now_iso)
             
             # Collect pipeline metadata
-            pipeline_metadata = self._collect_pipeline_metadata()
+            pipeline_metadata = self._collect_pipeline_metadata(summarized_data)
             
             # Generate newsletter output
-            newsletter_output = self._generate_newsletter_output(summarized_data, pipeline_metadata)
+            newsletter_output = self._generate_newsletter_output(
+                summarized_data, pipeline_metadata, now_iso, now.strftime("%B %d, %Y")
+            )
             
             # Save output
             output_file = self._save_newsletter_output(newsletter_output)
@@ -56,193 +177,135 @@ class NewsletterGenerationStep:
                 "statistics": stats,
                 "metadata": {
                     "step": self.step_name,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": now_iso,
                     "processing_time_seconds": 0,  # This step is very fast
-                    "articles_processed": len(newsletter_output['content']['headlines']) + 
-                                        len(newsletter_output['content']['secondary']) + 
-                                        len(newsletter_output['content']['optional'])
+                    "articles_processed": newsletter_output['metadata']['total_articles_final']
                 }
             }
             
         except Exception as e:
             self.logger.error(f"❌ Newsletter generation failed: {e}")
-            return {
-                "success": False,
-                "error": str(e),
-                "metadata": {
-                    "step": self.step_name,
-                    "timestamp": datetime.now().isoformat(),
-                    "processing_time_seconds": 0
-                }
+            return self._create_failure_result(str(e), now_iso)
+    
+    def _create_failure_result(self, error: str, timestamp: str) -> Dict[str, Any]:
+        """Build the step result returned when newsletter generation fails."""
+        return {
+            "success": False,
+            "error": error,
+            "metadata": {
+                "step": self.step_name,
+                "timestamp": timestamp,
+                "processing_time_seconds": 0
             }
+        }
     
-    def _load_summarized_content(self) -> Dict[str, Any]:
-        """Load the most recent summarized content."""
-        processed_dir = Path(self.data_paths['processed'])
-        summarized_path = processed_dir / "summarized_content.json"
+    def _load_summarized_content(self) -> Optional[Dict[str, Any]]:
+        """Load the most recent summarized content, or None if the summarization output does not exist."""
+        summarized_path = self.processed_dir / "summarized_content.json"
         
         if not summarized_path.exists():
-            raise Exception("No summarized content files found")
+            return None
         
         self.logger.info(f"📄 Loading summarized content from: {summarized_path.name}")
         
-        with open(summarized_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(summarized_path, use_mmap=True)
     
-    def _collect_pipeline_metadata(self) -> Dict[str, Any]:
-        """Collect metadata from all pipeline steps."""
+    def _collect_pipeline_metadata(self, summarized_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Collect metadata from all pipeline steps; summarization comes from the already loaded summaries."""
         metadata = {}
-        processed_dir = Path(self.data_paths['processed'])
         
-        # RSS Gathering - estimate from first step's input
-        all_files = list(processed_dir.glob("*.json"))
-        if all_files:
-            first_file = min(all_files, key=os.path.getctime)
-            with open(first_file, 'r', encoding='utf-8') as f:
-                first_data = json.load(f)
-                # Get RSS data from the first step's input
-                articles_input = first_data.get('metadata', {}).get('total_articles_input', 0)
-                metadata['rss_gathering'] = {
-                    'articles_collected': articles_input,
-                    'feeds_processed': 0,  # Unknown
-                    'successful_feeds': 0,  # Unknown
-                    'failed_feeds': 0,  # Unknown
-                    'processing_time': 0,  # Unknown
-                    'timestamp': first_data.get('metadata', {}).get('processing_timestamp', '')
-                }
-        
-        # Content Filtering
-        filtering_path = processed_dir / "filtered_content.json"
-        if filtering_path.exists():
-            with open(filtering_path, 'r', encoding='utf-8') as f:
-                filtering_data = json.load(f)
-                metadata['content_filtering'] = {
-                    'articles_input': filtering_data.get('metadata', {}).get('total_articles_input', 0),
-                    'articles_passed': filtering_data.get('metadata', {}).get('total_articles_passed', 0),
-                    'articles_filtered': filtering_data.get('metadata', {}).get('total_articles_rejected', 0),
-                    'pass_rate': filtering_data.get('metadata', {}).get('filter_pass_rate', 0),
-                    'processing_time': 0,  # Not available in this file
-                    'timestamp': filtering_data.get('metadata', {}).get('processing_timestamp', '')
-                }
-        
-        # Ad Detection
-        ad_detection_path = processed_dir / "ad_filtered_content.json"
-        if ad_detection_path.exists():
-            with open(ad_detection_path, 'r', encoding='utf-8') as f:
-                ad_detection_data = json.load(f)
-                metadata['ad_detection'] = {
-                    'articles_input': ad_detection_data.get('statistics', {}).get('articles_input', 0),
-                    'articles_passed': ad_detection_data.get('statistics', {}).get('articles_passed', 0),
-                    'articles_filtered': ad_detection_data.get('statistics', {}).get('articles_filtered', 0),
-                    'pass_rate': ad_detection_data.get('statistics', {}).get('pass_rate', 0),
-                    'ad_percentage': ad_detection_data.get('statistics', {}).get('ad_statistics', {}).get('ad_percentage', 0),
-                    'news_percentage': ad_detection_data.get('statistics', {}).get('ad_statistics', {}).get('news_percentage', 0),
-                    'processing_time': ad_detection_data.get('metadata', {}).get('processing_time_seconds', 0),
-                    'timestamp': ad_detection_data.get('metadata', {}).get('timestamp', '')
-                }
-        
-        # Quality Scoring
-        quality_path = processed_dir / "quality_scored_content.json"
-        if quality_path.exists():
-            with open(quality_path, 'r', encoding='utf-8') as f:
-                quality_data = json.load(f)
-                metadata['quality_scoring'] = {
-                    'articles_processed': quality_data.get('statistics', {}).get('articles_input', 0),
-                    'articles_passed': quality_data.get('statistics', {}).get('articles_passed', 0),
-                    'articles_filtered': quality_data.get('statistics', {}).get('articles_filtered', 0),
-                    'pass_rate': quality_data.get('statistics', {}).get('pass_rate', 0),
-                    'processing_time': quality_data.get('metadata', {}).get('processing_time_seconds', 0),
-                    'timestamp': quality_data.get('metadata', {}).get('timestamp', '')
-                }
-        
-        # Deduplication
-        dedup_path = processed_dir / "deduplicated_content.json"
-        if dedup_path.exists():
-            with open(dedup_path, 'r', encoding='utf-8') as f:
-                dedup_data = json.load(f)
-                articles_input = dedup_data.get('statistics', {}).get('articles_input', 0)
-                articles_selected = dedup_data.get('statistics', {}).get('articles_selected', 0)
-                duplicates_removed = dedup_data.get('statistics', {}).get('total_duplicates_removed', 0)
-                reduction_percentage = dedup_data.get('statistics', {}).get('deduplication_rate', 0)
-                metadata['deduplication'] = {
-                    'articles_before': articles_input,
-                    'articles_after': articles_selected,
-                    'duplicates_removed': duplicates_removed,
-                    'reduction_percentage': reduction_percentage,
-                    'processing_time': dedup_data.get('metadata', {}).get('processing_time_seconds', 0),
-                    'timestamp': dedup_data.get('metadata', {}).get('timestamp', '')
-                }
-        
-        # Article Prioritization
-        prioritization_path = processed_dir / "prioritized_content.json"
-        if prioritization_path.exists():
-            with open(prioritization_path, 'r', encoding='utf-8') as f:
-                prioritization_data = json.load(f)
-                metadata['prioritization'] = {
-                    'articles_processed': prioritization_data.get('metadata', {}).get('articles_processed', 0),
-                    'headlines_count': len(prioritization_data.get('categorization', {}).get('headlines', [])),
-                    'secondary_count': len(prioritization_data.get('categorization', {}).get('secondary', [])),
-                    'optional_count': len(prioritization_data.get('categorization', {}).get('optional', [])),
-                    'llm_success': prioritization_data.get('metadata', {}).get('llm_success', False),
-                    'fallback_used': prioritization_data.get('metadata', {}).get('fallback_used', False),
-                    'processing_time': prioritization_data.get('metadata', {}).get('processing_time_seconds', 0),
-                    'timestamp': prioritization_data.get('metadata', {}).get('timestamp', '')
-                }
+        # List the directory once; DirEntry caches its stat result
+        with os.scandir(self.processed_dir) as it:
+            entries = {entry.name: entry for entry in it if entry.name.endswith('.json') and entry.is_file()}
+        
+        # Extract every available step output in one table-driven pass
+        step_metadata = {}
+        loaded_by_name = {'summarized_content.json': summarized_data}
+        for key, filename, fields in _STEP_SPECS:
+            data = loaded_by_name.get(filename)
+            if data is None:
+                if filename not in entries:
+                    continue
+                data = loaded_by_name[filename] = load_json(entries[filename].path, use_mmap=True)
+            step_metadata[key] = {field: _pick(data, path, default) for field, (path, default) in fields.items()}
+            if key == 'prioritization':
+                categorization = data.get('categorization') or {}
+                for field, category in _PRIORITIZATION_COUNTS.items():
+                    step_metadata[key][field] = len(categorization.get(category, []))
         
-        # Summarization
-        summarization_path = processed_dir / "summarized_content.json"
-        if summarization_path.exists():
-            with open(summarization_path, 'r', encoding='utf-8') as f:
-                summarization_data = json.load(f)
-                metadata['summarization'] = {
-                    'articles_processed': summarization_data.get('metadata', {}).get('articles_processed', 0),
-                    'processing_time': summarization_data.get('metadata', {}).get('processing_time_seconds', 0),
-                    'llm_success_count': summarization_data.get('statistics', {}).get('llm_success_count', 0),
-                    'fallback_count': summarization_data.get('statistics', {}).get('fallback_count', 0),
-                    'timestamp': summarization_data.get('metadata', {}).get('timestamp', '')
-                }
+        # RSS Gathering - estimate from first step's input
+        if entries:
+            first_file = min(entries.values(), key=lambda entry: entry.stat().st_ctime)
+            first_data = loaded_by_name.get(first_file.name) or load_json(first_file.path, use_mmap=True)
+            md = first_data.get('metadata') or {}
+            metadata['rss_gathering'] = {
+                'articles_collected': md.get('total_articles_input', 0),
+                'feeds_processed': 0,  # Unknown
+                'successful_feeds': 0,  # Unknown
+                'failed_feeds': 0,  # Unknown
+                'processing_time': 0,  # Unknown
+                'timestamp': md.get('processing_timestamp', '')
+            }
+        metadata.update(step_metadata)
         
         return metadata
     
-    def _generate_newsletter_output(self, summarized_data: Dict[str, Any], pipeline_metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _generate_newsletter_output(self, summarized_data: Dict[str, Any], pipeline_metadata: Dict[str, Any],
+                                    now_iso: str, now_date: str) -> Dict[str, Any]:
         """Generate clean newsletter output with pipeline visualization."""
+        summaries = summarized_data.get('summaries') or {}
+        headlines = self._format_articles(summaries.get('headlines', ()))
+        secondary = self._format_articles(summaries.get('secondary', ()))
+        optional = self._format_articles(summaries.get('optional', ()))
         
         # Create clean newsletter format
         newsletter_output = {
             "newsletter": {
                 "title": "Bit-by-Bit Tech Newsletter",
-                "date": datetime.now().strftime("%B %d, %Y"),
-                "generated_at": datetime.now().isoformat(),
+                "date": now_date,
+                "generated_at": now_iso,
                 "pipeline_version": "1.0.0"
             },
             "content": {
-                "headlines": self._format_articles(summarized_data.get('summaries', {}).get('headlines', [])),
-                "secondary": self._format_articles(summarized_data.get('summaries', {}).get('secondary', [])),
-                "optional": self._format_articles(summarized_data.get('summaries', {}).get('optional', []))
-            },
-            "pipeline_visualization": {
-                "overview": self._create_pipeline_overview(pipeline_metadata),
-                "data_flow": self._create_data_flow_visualization(pipeline_metadata),
-                "quality_analysis": self._create_quality_analysis(summarized_data),
-                "source_analysis": self._create_source_analysis(pipeline_metadata),
-                "processing_stats": self._create_processing_stats(pipeline_metadata)
-            },
-            "metadata": {
-                "total_articles_final": len(summarized_data.get('summaries', {}).get('headlines', [])) + 
-                                      len(summarized_data.get('summaries', {}).get('secondary', [])) + 
-                                      len(summarized_data.get('summaries', {}).get('optional', [])),
-                "generation_time": datetime.now().isoformat(),
-                "pipeline_steps_completed": len(pipeline_metadata)
+                "headlines": headlines,
+                "secondary": secondary,
+                "optional": optional
             }
         }
         
+        if self.include_visualization:
+            newsletter_output["pipeline_visualization"] = self._create_pipeline_visualization(summaries, pipeline_metadata)
+        
+        newsletter_output["metadata"] = {
+            "total_articles_final": len(headlines) + len(secondary) + len(optional),
+            "generation_time": now_iso,
+            "pipeline_steps_completed": len(pipeline_metadata)
+        }
+        
         return newsletter_output
     
-    def _format_articles(self, articles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _create_pipeline_visualization(self, summaries: Dict[str, Any], pipeline_metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the enabled pipeline visualization sections."""
+        # Shared by the overview and processing stats
+        total_time = sum(step.get('processing_time', 0) for step in pipeline_metadata.values())
+        
+        visualization = {
+            "overview": self._create_pipeline_overview(pipeline_metadata, total_time),
+            "data_flow": self._create_data_flow_visualization(pipeline_metadata)
+        }
+        if self.include_quality_analysis:
+            visualization["quality_analysis"] = self._create_quality_analysis(summaries)
+        if self.include_source_analysis:
+            visualization["source_analysis"] = self._create_source_analysis(pipeline_metadata)
+        if self.include_processing_stats:
+            visualization["processing_stats"] = self._create_processing_stats(pipeline_metadata, total_time)
+        
+        return visualization
+    
+    def _format_articles(self, articles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Format articles for newsletter."""
-        formatted = []
-        for i, article in enumerate(articles, 1):
-            formatted.append({
+        return [
+            {
                 "rank": i,
                 "title": article.get('title', ''),
                 "summary": article.get('summary', ''),
@@ -253,10 +316,11 @@ class NewsletterGenerationStep:
                 "quality_level": article.get('quality_level', ''),
                 "content_source": article.get('content_source_used', ''),
                 "fallback_used": article.get('fallback_used', False)
-            })
-        return formatted
+            }
+            for i, article in enumerate(articles, 1)
+        ]
     
-    def _create_pipeline_overview(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_pipeline_overview(self, metadata: Dict[str, Any], total_time: float) -> Dict[str, Any]:
         """Create pipeline overview visualization data."""
         overview = {
             "total_steps": len(metadata),
@@ -267,7 +331,7 @@ class NewsletterGenerationStep:
                 "reduction_percentage": 0
             },
             "processing_time": {
-                "total_seconds": sum(step.get('processing_time', 0) for step in metadata.values()),
+                "total_seconds": total_time,
                 "breakdown": {step: data.get('processing_time', 0) for step, data in metadata.items()}
             }
         }
@@ -283,75 +347,17 @@ class NewsletterGenerationStep:
     def _create_data_flow_visualization(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Create data flow visualization data."""
         flow = []
-        
-        # RSS Gathering
-        if 'rss_gathering' in metadata:
+        for label, key, describe in _FLOW_STEPS:
+            step = metadata.get(key)
+            if step is None:
+                continue
+            step_input, step_output, description = describe(step)
             flow.append({
-                "step": "RSS Gathering",
-                "input": 0,
-                "output": metadata['rss_gathering']['articles_collected'],
-                "processing_time": metadata['rss_gathering']['processing_time'],
-                "description": f"Collected {metadata['rss_gathering']['articles_collected']} articles from {metadata['rss_gathering']['feeds_processed']} feeds"
-            })
-        
-        # Content Filtering
-        if 'content_filtering' in metadata:
-            flow.append({
-                "step": "Content Filtering",
-                "input": metadata['content_filtering']['articles_input'],
-                "output": metadata['content_filtering']['articles_passed'],
-                "processing_time": metadata['content_filtering']['processing_time'],
-                "description": f"Filtered {metadata['content_filtering']['articles_passed']}/{metadata['content_filtering']['articles_input']} articles ({metadata['content_filtering']['pass_rate']:.1f}% pass rate)"
-            })
-        
-        # Ad Detection
-        if 'ad_detection' in metadata:
-            flow.append({
-                "step": "Ad Detection",
-                "input": metadata['ad_detection']['articles_input'],
-                "output": metadata['ad_detection']['articles_passed'],
-                "processing_time": metadata['ad_detection']['processing_time'],
-                "description": f"Removed {metadata['ad_detection']['articles_filtered']} ads, kept {metadata['ad_detection']['articles_passed']} articles ({metadata['ad_detection']['pass_rate']:.1f}% pass rate)"
-            })
-        
-        # Quality Scoring
-        if 'quality_scoring' in metadata:
-            flow.append({
-                "step": "Quality Scoring",
-                "input": metadata['quality_scoring']['articles_processed'],
-                "output": metadata['quality_scoring']['articles_passed'],
-                "processing_time": metadata['quality_scoring']['processing_time'],
-                "description": f"Scored {metadata['quality_scoring']['articles_processed']} articles, kept {metadata['quality_scoring']['articles_passed']} ({metadata['quality_scoring']['pass_rate']:.1f}% pass rate)"
-            })
-        
-        # Deduplication
-        if 'deduplication' in metadata:
-            flow.append({
-                "step": "Deduplication",
-                "input": metadata['deduplication']['articles_before'],
-                "output": metadata['deduplication']['articles_after'],
-                "processing_time": metadata['deduplication']['processing_time'],
-                "description": f"Removed {metadata['deduplication']['duplicates_removed']} duplicates ({metadata['deduplication']['reduction_percentage']:.1f}% reduction)"
-            })
-        
-        # Prioritization
-        if 'prioritization' in metadata:
-            flow.append({
-                "step": "Prioritization",
-                "input": metadata['prioritization']['articles_processed'],
-                "output": metadata['prioritization']['articles_processed'],
-                "processing_time": metadata['prioritization']['processing_time'],
-                "description": f"Categorized into {metadata['prioritization']['headlines_count']} headlines, {metadata['prioritization']['secondary_count']} secondary, {metadata['prioritization']['optional_count']} optional"
-            })
-        
-        # Summarization
-        if 'summarization' in metadata:
-            flow.append({
-                "step": "Summarization",
-                "input": metadata['summarization']['articles_processed'],
-                "output": metadata['summarization']['articles_processed'],
-                "processing_time": metadata['summarization']['processing_time'],
-                "description": f"Summarized {metadata['summarization']['articles_processed']} articles for newsletter"
+                "step": label,
+                "input": step_input,
+                "output": step_output,
+                "processing_time": step['processing_time'],
+                "description": description
             })
         
         # Calculate total reduction from start to end
@@ -370,36 +376,36 @@ class NewsletterGenerationStep:
             "reduction_percentage": reduction_percentage
         }
     
-    def _create_quality_analysis(self, summarized_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create quality analysis visualization data."""
-        all_articles = []
-        for category in ['headlines', 'secondary', 'optional']:
-            all_articles.extend(summarized_data.get('summaries', {}).get(category, []))
-        
-        if not all_articles:
+    def _create_quality_analysis(self, summaries: Dict[str, Any]) -> Dict[str, Any]:
+        """Create quality analysis visualization data from the per-category summaries."""
+        # Single pass over all categories for count, sum, min, max and level histogram;
+        # scores are folded as they stream by, so no per-article score list is allocated
+        total = 0
+        score_sum = 0
+        min_score = None
+        max_score = None
+        level_counts = Counter()
+        for article in chain.from_iterable(summaries.get(category, ()) for category in _SUMMARY_CATEGORIES):
+            score = article.get('quality_score', 0)
+            total += 1
+            score_sum += score
+            if min_score is None or score < min_score:
+                min_score = score
+            if max_score is None or score > max_score:
+                max_score = score
+            level_counts[article.get('quality_level', '')] += 1
+        
+        if not total:
             return {"error": "No articles found for quality analysis"}
         
-        quality_scores = [article.get('quality_score', 0) for article in all_articles]
-        quality_levels = [article.get('quality_level', '') for article in all_articles]
-        
-        # Calculate quality statistics
-        avg_score = sum(quality_scores) / len(quality_scores) if quality_scores else 0
-        min_score = min(quality_scores) if quality_scores else 0
-        max_score = max(quality_scores) if quality_scores else 0
-        
-        # Count quality levels
-        level_counts = {}
-        for level in quality_levels:
-            level_counts[level] = level_counts.get(level, 0) + 1
-        
         return {
-            "total_articles": len(all_articles),
-            "average_quality_score": round(avg_score, 1),
+            "total_articles": total,
+            "average_quality_score": round(score_sum / total, 1),
             "min_quality_score": min_score,
             "max_quality_score": max_score,
-            "quality_distribution": level_counts,
+            "quality_distribution": dict(level_counts),
             "score_range": f"{min_score}-{max_score}",
-            "high_quality_percentage": round((level_counts.get('excellent', 0) + level_counts.get('high', 0)) / len(all_articles) * 100, 1) if all_articles else 0
+            "high_quality_percentage": round((level_counts['excellent'] + level_counts['high']) / total * 100, 1)
         }
     
     def _create_source_analysis(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
@@ -417,41 +423,66 @@ class NewsletterGenerationStep:
             "articles_per_feed": round(rss_data['articles_collected'] / rss_data['successful_feeds'], 1) if rss_data['successful_feeds'] > 0 else 0
         }
     
-    def _create_processing_stats(self, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    def _create_processing_stats(self, metadata: Dict[str, Any], total_time: float) -> Dict[str, Any]:
         """Create processing statistics visualization data."""
-        total_time = sum(step.get('processing_time', 0) for step in metadata.values())
+        # One pass for slowest/fastest step and the rounded breakdown; ties keep the first step
+        slowest_step = fastest_step = None
+        slowest_time = float('-inf')
+        fastest_time = float('inf')
+        step_breakdown = {}
+        for step, data in metadata.items():
+            step_time = data.get('processing_time', 0)
+            step_breakdown[step] = round(step_time, 1)
+            if step_time > slowest_time:
+                slowest_time, slowest_step = step_time, step
+            if step_time < fastest_time:
+                fastest_time, fastest_step = step_time, step
         
         return {
             "total_processing_time": round(total_time, 1),
             "average_time_per_step": round(total_time / len(metadata), 1) if metadata else 0,
-            "slowest_step": max(metadata.items(), key=lambda x: x[1].get('processing_time', 0))[0] if metadata else None,
-            "fastest_step": min(metadata.items(), key=lambda x: x[1].get('processing_time', 0))[0] if metadata else None,
-            "step_breakdown": {step: round(data.get('processing_time', 0), 1) for step, data in metadata.items()}
+            "slowest_step": slowest_step,
+            "fastest_step": fastest_step,
+            "step_breakdown": step_breakdown
         }
     
     def _save_newsletter_output(self, newsletter_output: Dict[str, Any]) -> str:
         """Save newsletter output to file."""
         # Use fixed filename within run directory
-        output_file = self.output_dir / "newsletter_output.json"
+        output_file = self.processed_dir / ("newsletter_output.json.gz" if self.gzip_output else "newsletter_output.json")
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(newsletter_output, f, indent=2, ensure_ascii=False)
+        payload = dumps_json(newsletter_output, indent=self.pretty_output)
+        
+        # Write to a temp file and rename so readers never see a partially written newsletter
+        tmp_file = output_file.with_name(output_file.name + '.tmp')
+        try:
+            if self.gzip_output:
+                # Level 1 keeps compression close to write speed
+                with gzip.open(tmp_file, 'wb', compresslevel=1) as f:
+                    f.write(payload)
+            else:
+                tmp_file.write_bytes(payload)
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
         
         return str(output_file)
     
     def _create_statistics(self, newsletter_output: Dict[str, Any], pipeline_metadata: Dict[str, Any]) -> Dict[str, Any]:
         """Create statistics for the newsletter generation step."""
         content = newsletter_output['content']
-        overview = newsletter_output['pipeline_visualization']['overview']
-        quality = newsletter_output['pipeline_visualization']['quality_analysis']
+        visualization = newsletter_output.get('pipeline_visualization', {})
+        overview = visualization.get('overview', {})
+        quality = visualization.get('quality_analysis', {})
         
         return {
             "headlines_count": len(content['headlines']),
             "secondary_count": len(content['secondary']),
             "optional_count": len(content['optional']),
-            "total_articles": len(content['headlines']) + len(content['secondary']) + len(content['optional']),
-            "data_reduction_percentage": overview['data_reduction']['reduction_percentage'],
-            "average_quality_score": quality['average_quality_score'],
-            "high_quality_percentage": quality['high_quality_percentage'],
-            "total_processing_time": overview['processing_time']['total_seconds']
+            "total_articles": newsletter_output['metadata']['total_articles_final'],
+            "data_reduction_percentage": overview.get('data_reduction', {}).get('reduction_percentage', 0),
+            "average_quality_score": quality.get('average_quality_score', 0),
+            "high_quality_percentage": quality.get('high_quality_percentage', 0),
+            "total_processing_time": overview.get('processing_time', {}).get('total_seconds', 0)
         }
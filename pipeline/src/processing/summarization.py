@@ -5,23 +5,100 @@ This step creates concise, newsletter-ready summaries of prioritized articles
 with different lengths based on their category (headlines, secondary, optional).
 """
 
-import json
 import time
+import asyncio
+import hashlib
 import logging
+import math
 import os
 import re
+import threading
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple
 
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 from src.utils.logger import get_logger
-from src.utils.config_loader import ConfigLoader
+from src.utils.config_loader import ConfigLoader, resolve_pipeline_path
 from src.utils.together_client import create_together_client
+from src.utils.json_utils import load_json, loads_json, dump_json
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+# Patterns used by _clean_text, compiled once at import
+_HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_PUNCTUATION_PATTERN = re.compile(r'[^\w\s\-.,!?:;()]')
+
+# Summary categories, processed in this order (keeps each category's prompt prefix hot)
+_CATEGORIES = ('headlines', 'secondary', 'optional')
+
+# Per-category (title requirement, summary requirement, example)
+_CATEGORY_REQUIREMENTS = {
+    'headlines': (
+        "8-12 words max (60-80 characters)",
+        "2-3 sentences, 45-60 words total. Include what happened + why it matters",
+        "Microsoft launched a unified Marketplace combining Azure solutions, AI apps, and Copilot agents. The move streamlines enterprise adoption by cutting setup times and expanding access to over 3,000 AI offerings, making it easier for companies to integrate AI into daily workflows."
+    ),
+    'secondary': (
+        "8-12 words max (60-80 characters)",
+        "1 sentence, 20-30 words. Straight 'what happened'",
+        "NVIDIA unveiled a new GPU optimized for AI workloads, promising faster performance and lower energy use for enterprise-scale training and inference."
+    ),
+    'optional': (
+        "8-12 words max (60-80 characters)",
+        "1 short, descriptive sentence (15-25 words). More informative than a title but very concise",
+        "OnePlus 15 launches with latest Snapdragon chipset, promising enhanced performance and efficiency for flagship smartphones."
+    ),
+}
+
+# Category-invariant part of the summarization prompt; the article details follow it
+_SUMMARY_PROMPT_PREFIX = """You are an expert tech newsletter editor. Create a concise, newsletter-ready summary for the article given after these instructions.
+
+CATEGORY: {category}
+
+REQUIREMENTS:
+- New Title: {title_requirement}
+- Summary: {summary_requirement}
+
+EXAMPLE FOR {category}:
+{example}
+
+INSTRUCTIONS:
+- Make titles reader-friendly, avoid marketing fluff
+- Focus on what happened and why it matters (for headlines)
+- Keep language clear and professional
+- Ensure the summary fits the word count requirements
+- For optional articles: create a short, descriptive sentence that's more informative than a title
+
+Respond ONLY with a JSON object in this exact format:
+{{
+    "title": "<new concise title>",
+    "summary": "<summary based on requirements>",
+    "word_count": <actual word count of summary>,
+    "content_source_used": "<the article's Content Source>"
+}}
 
+Focus on creating content that would be valuable for tech professionals and enthusiasts."""
 
 class SummarizationStep:
     """
@@ -56,12 +133,81 @@ class SummarizationStep:
             # Fallback to Ollama configuration
             self.ollama_endpoint = self.llm_config['ollama']['server_url']
             self.model_name = self.llm_config['ollama']['model']
+            # Keep the model (and its prompt cache) loaded between articles
+            self.keep_alive = self.llm_config['ollama'].get('keep_alive', -1)
+            # Context sized for the instructions plus truncated content; output is a small JSON object
+            summarization_llm_config = self.llm_config.get('summarization', {})
+            self.num_ctx = summarization_llm_config.get('num_ctx', 4096)
+            self.num_predict = summarization_llm_config.get('num_predict', 256)
+        
+        # Optional per-category model tier (e.g. a smaller model for optional articles) and
+        # output token limits sized to each category's summary length
+        provider_config = self.llm_config.get('together_ai' if self.provider == 'together_ai' else 'ollama', {})
+        category_models = provider_config.get('category_models', {})
+        self.category_models = {category: category_models.get(category) or self.model_name for category in _CATEGORIES}
+        self.category_max_tokens = self.llm_config.get('category_max_tokens', {})
+        
+        # Upper bound on in-flight LLM requests; match Ollama's OLLAMA_NUM_PARALLEL
+        self.max_concurrency = self.llm_config.get('max_concurrency', 8)
+        
+        # Per-request timeout. Requests beyond Ollama's parallel slots wait in its queue before
+        # generation starts (and nothing is streamed back meanwhile), so the budget covers
+        # one generation per request queued ahead
+        self.request_timeout = self.llm_config.get('summarization', {}).get('timeout_seconds', 60)
+        if self.provider != 'together_ai':
+            num_parallel = max(1, self.llm_config['ollama'].get('num_parallel', 4))
+            self.request_timeout *= math.ceil(self.max_concurrency / num_parallel)
+        
+        # Pooled keep-alive session for synchronous Ollama calls (used when aiohttp is unavailable);
+        # transient connection resets and gateway errors are retried briefly
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=max(16, self.max_concurrency),
+            max_retries=Retry(
+                total=2,
+                read=False,  # Never re-send a POST after a read timeout; re-raise it as a timeout
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(['POST'])
+            )
+        ))
         
         # Summarization configuration
         self.summarization_config = self.config['summarization']
         self.max_content_tokens = self.config.get('text_processing', {}).get('max_content_tokens', 2000)
         self.fallback_summary_tokens = self.summarization_config['fallback_summary_tokens']
         
+        # Exact BPE token counts for truncation when tiktoken (and its encoding file) is available
+        self._encoding = None
+        if TIKTOKEN_AVAILABLE:
+            encoding_name = self.config.get('text_processing', {}).get('tokenizer_encoding', 'cl100k_base')
+            try:
+                self._encoding = tiktoken.get_encoding(encoding_name)
+            except Exception as e:
+                self.logger.warning(f"⚠️ tiktoken encoding {encoding_name} unavailable, estimating tokens from characters: {e}")
+        # Re-runs and shared articles truncate the same text repeatedly
+        self._truncate_cached = lru_cache(maxsize=1024)(self._truncate_uncached)
+        
+        # Persistent summary cache shared across runs: one small file per entry, so a run
+        # only reads the entries it needs; entries unused for max_age_days are pruned
+        cache_config = self.config.get('cache', {})
+        self.cache_enabled = cache_config.get('enabled', True)
+        self.cache_dir = resolve_pipeline_path(cache_config.get('cache_dir', 'data/cache')) / 'summaries'
+        self.cache_max_age_days = cache_config.get('max_age_days', 30)
+        
+        # Compact JSON output unless pretty-printing is requested for debugging
+        self.pretty_output = self.config.get('output', {}).get('pretty', False)
+        
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+    
+    def __del__(self):
+        session = getattr(self, 'session', None)
+        if session is not None:
+            session.close()
+    
     def _load_input_data(self) -> Dict[str, Any]:
         """Load input data from article prioritization step."""
         import glob
@@ -78,8 +224,7 @@ class SummarizationStep:
                 raise FileNotFoundError(f"Input file not found: {fixed_input}")
             self.logger.info(f"Loading input data from: {fixed_input}")
             
-            with open(fixed_input, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = load_json(fixed_input)
             
             self.logger.info(f"Loaded prioritized articles from input file")
             return data
@@ -97,8 +242,7 @@ class SummarizationStep:
             filename = filename_template.replace('_{timestamp}', '').replace('{timestamp}_', '').replace('{timestamp}', '')
             output_path = Path(self.data_paths['processed']) / filename
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            dump_json(output_data, output_path, indent=self.pretty_output)
             
             self.logger.info(f"💾 Saved summarized articles to: {output_path}")
             return str(output_path)
@@ -107,19 +251,81 @@ class SummarizationStep:
             self.logger.error(f"Failed to save output data: {e}")
             raise
     
+    def _get_summary_cache_key(self, prepared_article: Dict[str, Any], category: str) -> str:
+        """Cache key: provider, category model, output limit and the full prompt sent to the LLM."""
+        return hashlib.blake2b(
+            f"{self.provider}|{self.category_models.get(category, self.model_name)}|"
+            f"{self._max_output_tokens(category)}|"
+            f"{self._create_summarization_prompt(prepared_article, category)}".encode('utf-8'),
+            digest_size=16
+        ).hexdigest()
+    
+    def _get_summary_cache_path(self, key: str) -> Path:
+        """Path of a single cached summary, sharded by key prefix."""
+        return self.cache_dir / key[:2] / f"{key}.json"
+    
+    def _lookup_summary_cache(self, prepared_article: Dict[str, Any], category: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Return (cache key, cached LLM response or None); the key is None when caching is off."""
+        if not self.cache_enabled:
+            return None, None
+        key = self._get_summary_cache_key(prepared_article, category)
+        cache_path = self._get_summary_cache_path(key)
+        try:
+            cached = load_json(cache_path)
+            # Refresh the entry's age so summaries still in use are not pruned
+            os.utime(cache_path)
+            return key, cached
+        except FileNotFoundError:
+            return key, None
+        except Exception as e:
+            self.logger.warning(f"⚠️ Ignoring unreadable summary cache entry {cache_path}: {e}")
+            return key, None
+    
+    def _store_summary_cache(self, key: str, llm_response: Dict[str, Any]) -> None:
+        """Write one cached summary atomically (identical articles may finish concurrently)."""
+        cache_path = self._get_summary_cache_path(key)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            dump_json(llm_response, tmp_path, indent=False)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            self.logger.warning(f"⚠️ Failed to write summary cache entry {cache_path}: {e}")
+    
+    def _prune_summary_cache(self) -> None:
+        """Delete cached summaries not used within max_age_days."""
+        if not self.cache_max_age_days or not self.cache_dir.exists():
+            return
+        
+        cutoff = time.time() - self.cache_max_age_days * 86400
+        pruned = 0
+        for shard in os.scandir(self.cache_dir):
+            if not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                try:
+                    if entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                        pruned += 1
+                except OSError:
+                    pass
+        
+        if pruned:
+            self.logger.info(f"🧹 Pruned {pruned} summary cache entries unused for {self.cache_max_age_days} days")
+    
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text for better processing."""
         if not text:
             return ""
             
         # Remove HTML tags
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_PATTERN.sub('', text)
         
         # Normalize whitespace
-        text = ' '.join(text.split())
+        text = _WHITESPACE_PATTERN.sub(' ', text)
         
         # Remove excessive punctuation but keep common punctuation
-        text = re.sub(r'[^\w\s\-.,!?:;()]', '', text)
+        text = _PUNCTUATION_PATTERN.sub('', text)
         
         return text.strip()
     
@@ -127,18 +333,31 @@ class SummarizationStep:
         """Truncate content to fit within token limits."""
         if not content:
             return ""
-        
-        # Rough estimation: 1 token ≈ 4 characters for English text
-        max_chars = max_tokens * 4
-        
-        if len(content) <= max_chars:
-            return content
+        return self._truncate_cached(content, max_tokens)
+    
+    def _truncate_uncached(self, content: str, max_tokens: int) -> str:
+        """Truncate content to max_tokens, counting BPE tokens with tiktoken or estimating from characters."""
+        if self._encoding is not None:
+            # Every token covers at least one character, so short content always fits
+            if len(content) <= max_tokens:
+                return content
+            token_ids = self._encoding.encode(content, disallowed_special=())
+            if len(token_ids) <= max_tokens:
+                return content
+            truncated = self._encoding.decode(token_ids[:max_tokens])
+        else:
+            # Rough estimation: 1 token ≈ 4 characters for English text
+            max_chars = max_tokens * 4
+            
+            if len(content) <= max_chars:
+                return content
+            
+            truncated = content[:max_chars]
         
         # Truncate at word boundary
-        truncated = content[:max_chars]
         last_space = truncated.rfind(' ')
         
-        if last_space > max_chars * 0.8:  # If we can find a good word boundary
+        if last_space > len(truncated) * 0.8:  # If we can find a good word boundary
             truncated = truncated[:last_space]
         
         return truncated + "..."
@@ -184,128 +403,140 @@ class SummarizationStep:
             'quality_level': article.get('quality_level', 'unknown')
         }
     
-    def _create_summarization_prompt(self, article: Dict[str, Any], category: str) -> str:
-        """Create prompt for LLM to summarize article based on category."""
-        
-        title = article['title']
-        content = article['content']
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _static_prefix(category: str) -> str:
+        """Instructions shared by every article in a category; sent first so the LLM can reuse its prefix cache."""
+        title_requirement, summary_requirement, example = _CATEGORY_REQUIREMENTS.get(
+            category, _CATEGORY_REQUIREMENTS['optional']
+        )
+        return _SUMMARY_PROMPT_PREFIX.format(
+            category=category.upper(),
+            title_requirement=title_requirement,
+            summary_requirement=summary_requirement,
+            example=example
+        )
+    
+    def _dynamic_suffix(self, article: Dict[str, Any], category: str) -> str:
+        """Per-article part of the summarization prompt."""
         content_source = article['content_source']
         
-        # Define requirements based on category
-        if category == 'headlines':
-            title_requirement = "8-12 words max (60-80 characters)"
-            summary_requirement = "2-3 sentences, 45-60 words total. Include what happened + why it matters"
-            example = "Microsoft launched a unified Marketplace combining Azure solutions, AI apps, and Copilot agents. The move streamlines enterprise adoption by cutting setup times and expanding access to over 3,000 AI offerings, making it easier for companies to integrate AI into daily workflows."
-        elif category == 'secondary':
-            title_requirement = "8-12 words max (60-80 characters)"
-            summary_requirement = "1 sentence, 20-30 words. Straight 'what happened'"
-            example = "NVIDIA unveiled a new GPU optimized for AI workloads, promising faster performance and lower energy use for enterprise-scale training and inference."
-        else:  # optional
-            title_requirement = "8-12 words max (60-80 characters)"
-            summary_requirement = "1 short, descriptive sentence (15-25 words). More informative than a title but very concise"
-            example = "OnePlus 15 launches with latest Snapdragon chipset, promising enhanced performance and efficiency for flagship smartphones."
-        
         # Build content section based on what's available
         if content_source == 'full_content':
-            content_section = f"Content: {content}"
+            content_section = f"Content: {article['content']}"
         elif content_source == 'summary':
-            content_section = f"Summary: {content}"
+            content_section = f"Summary: {article['content']}"
         else:
             content_section = "No detailed content available"
         
-        prompt = f"""You are an expert tech newsletter editor. Create a concise, newsletter-ready summary for this article.
-
-ARTICLE DETAILS:
-Title: {title}
+        return f"""ARTICLE DETAILS:
+Title: {article['title']}
 {content_section}
 Category: {category.upper()}
-
-REQUIREMENTS:
-- New Title: {title_requirement}
-- Summary: {summary_requirement}
-
-EXAMPLE FOR {category.upper()}:
-{example}
-
-INSTRUCTIONS:
-- Make titles reader-friendly, avoid marketing fluff
-- Focus on what happened and why it matters (for headlines)
-- Keep language clear and professional
-- Ensure the summary fits the word count requirements
-- For optional articles: create a short, descriptive sentence that's more informative than a title
-
-Respond ONLY with a JSON object in this exact format:
-{{
-    "title": "<new concise title>",
-    "summary": "<summary based on requirements>",
-    "word_count": <actual word count of summary>,
-    "content_source_used": "{content_source}"
-}}
-
-Focus on creating content that would be valuable for tech professionals and enthusiasts."""
-
-        return prompt
+Content Source: {content_source}"""
+    
+    def _create_summarization_prompt(self, article: Dict[str, Any], category: str) -> str:
+        """Create prompt for LLM to summarize article based on category."""
+        return f"{self._static_prefix(category)}\n\n{self._dynamic_suffix(article, category)}"
     
-    def _call_llm(self, prompt: str) -> Dict[str, Any]:
+    def _max_output_tokens(self, category: str) -> Optional[int]:
+        """Output token limit for a category; None keeps the Together AI client's default."""
+        if category in self.category_max_tokens:
+            return self.category_max_tokens[category]
+        return self.num_predict if self.provider != 'together_ai' else None
+    
+    def _build_ollama_payload(self, article: Dict[str, Any], category: str) -> Dict[str, Any]:
+        """
+        Build the Ollama /api/generate request body for an article.
+        
+        The category instructions go in the system field and only the article details
+        in the prompt, so consecutive requests share an identical prefix whose KV cache
+        Ollama can reuse instead of re-prefilling it.
+        """
+        return {
+            "model": self.category_models.get(category, self.model_name),
+            "system": self._static_prefix(category),
+            "prompt": self._dynamic_suffix(article, category),
+            "stream": False,
+            "keep_alive": self.keep_alive,
+            "options": {
+                "temperature": 0.3,  # Lower temperature for more consistent results
+                "top_p": 0.9,
+                "num_ctx": self.num_ctx,
+                "num_predict": self._max_output_tokens(category)
+            }
+        }
+    
+    def _parse_llm_response(self, llm_response: str) -> Dict[str, Any]:
+        """Extract the JSON summary object from raw LLM output."""
+        try:
+            # Extract JSON from response (in case there's extra text)
+            json_start = llm_response.find('{')
+            json_end = llm_response.rfind('}') + 1
+            
+            if json_start == -1 or json_end == 0:
+                raise ValueError("No JSON found in LLM response")
+            
+            json_str = llm_response[json_start:json_end]
+            return loads_json(json_str)
+            
+        except ValueError as e:
+            self.logger.error(f"Failed to parse LLM JSON response: {e}")
+            self.logger.error(f"Raw response: {llm_response}")
+            raise Exception(f"Invalid JSON response from LLM: {e}")
+    
+    def _call_llm(self, article: Dict[str, Any], category: str) -> Dict[str, Any]:
         """Call LLM for article summarization with fallback support."""
         try:
             self.logger.debug(f"🤖 Calling LLM for article summarization...")
             
             if self.provider == 'together_ai':
                 # Use Together AI client
-                response = self.llm_client.generate_json_completion(prompt)
+                response = self.llm_client.generate_json_completion(
+                    self._create_summarization_prompt(article, category),
+                    model=self.category_models.get(category),
+                    max_tokens=self._max_output_tokens(category)
+                )
                 return response
             else:
                 # Fallback to Ollama
-                import requests
-                
-                payload = {
-                    "model": self.model_name,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.3,  # Lower temperature for more consistent results
-                        "top_p": 0.9,
-                        "max_tokens": 500
-                    }
-                }
-                
-                response = requests.post(
+                response = self.session.post(
                     f"{self.ollama_endpoint}/api/generate",
-                    json=payload,
-                    timeout=60
+                    json=self._build_ollama_payload(article, category),
+                    timeout=(10, self.request_timeout)
                 )
                 
                 if response.status_code != 200:
                     raise Exception(f"LLM API error: {response.status_code} - {response.text}")
                 
                 result = response.json()
-                llm_response = result.get('response', '')
-                
-                # Parse JSON response
-                try:
-                    # Extract JSON from response (in case there's extra text)
-                    json_start = llm_response.find('{')
-                    json_end = llm_response.rfind('}') + 1
-                    
-                    if json_start == -1 or json_end == 0:
-                        raise ValueError("No JSON found in LLM response")
-                    
-                    json_str = llm_response[json_start:json_end]
-                    parsed_response = json.loads(json_str)
-                    
-                    return parsed_response
-                    
-                except (json.JSONDecodeError, ValueError) as e:
-                    self.logger.error(f"Failed to parse LLM JSON response: {e}")
-                    self.logger.error(f"Raw response: {llm_response}")
-                    raise Exception(f"Invalid JSON response from LLM: {e}")
+                return self._parse_llm_response(result.get('response', ''))
                 
+        except requests.Timeout:
+            self.logger.warning(f"⏱️ LLM call timed out after {self.request_timeout}s: {article['title'][:50]}...")
+            return None
         except Exception as e:
             self.logger.error(f"❌ LLM call failed: {e}")
             # Return None to indicate LLM failure - will trigger fallback
             return None
     
+    async def _call_llm_async(self, article: Dict[str, Any], category: str, session) -> Optional[Dict[str, Any]]:
+        """Call Ollama over a shared aiohttp session; None signals failure, as in _call_llm."""
+        try:
+            payload = self._build_ollama_payload(article, category)
+            async with session.post(f"{self.ollama_endpoint}/api/generate", json=payload) as response:
+                if response.status != 200:
+                    raise Exception(f"LLM API error: {response.status} - {await response.text()}")
+                result = await response.json()
+            return self._parse_llm_response(result.get('response', ''))
+        
+        except asyncio.TimeoutError:
+            self.logger.warning(f"⏱️ LLM call timed out after {self.request_timeout}s: {article['title'][:50]}...")
+            return None
+        except Exception as e:
+            self.logger.error(f"❌ LLM call failed: {e}")
+            return None
+    
     def _create_fallback_summary(self, article: Dict[str, Any], category: str) -> Dict[str, Any]:
         """Create fallback summary when LLM fails."""
         title = article['title']
@@ -332,53 +563,128 @@ Focus on creating content that would be valuable for tech professionals and enth
             "fallback_used": True
         }
     
+    @staticmethod
+    def _lacks_usable_content(prepared_article: Dict[str, Any], category: str) -> bool:
+        """True when an LLM call could only rephrase the title, so the fallback is used directly."""
+        if prepared_article['content_source'] != 'none':
+            return False
+        return category == 'optional' or not prepared_article.get('original_summary')
+    
+    def _finalize_summary(self, prepared_article: Dict[str, Any], category: str,
+                          llm_response: Optional[Dict[str, Any]], skipped: bool = False) -> Dict[str, Any]:
+        """Turn an LLM response (or None on failure or skip) into a summary with article metadata."""
+        if skipped:
+            # No usable content - LLM was not called
+            summary_result = self._create_fallback_summary(prepared_article, category)
+            summary_result['skipped_no_content'] = True
+            self.logger.debug(f"⏭️ Skipping LLM for article without content: {prepared_article['title'][:50]}...")
+        elif llm_response is not None:
+            # LLM succeeded
+            summary_result = llm_response
+            summary_result['fallback_used'] = False
+            self.logger.debug(f"✅ LLM summarization successful for: {prepared_article['title'][:50]}...")
+        else:
+            # LLM failed - use fallback
+            summary_result = self._create_fallback_summary(prepared_article, category)
+            self.logger.warning(f"⚠️ Using fallback summarization for: {prepared_article['title'][:50]}...")
+        
+        # Add metadata
+        summary_result['original_title'] = prepared_article['title']
+        summary_result['original_url'] = prepared_article['url']
+        summary_result['feed_name'] = prepared_article['feed_name']
+        summary_result['quality_score'] = prepared_article['quality_score']
+        summary_result['quality_level'] = prepared_article['quality_level']
+        summary_result['category'] = category
+        
+        return summary_result
+    
+    def _create_error_summary(self, article: Dict[str, Any], category: str, error: Exception) -> Dict[str, Any]:
+        """Minimal fallback summary for an article that could not be processed at all."""
+        return {
+            "title": self._clean_text(article.get('title', 'Untitled')),
+            "summary": "",
+            "word_count": 0,
+            "content_source_used": "none",
+            "fallback_used": True,
+            "error": str(error),
+            "original_title": article.get('title', 'Untitled'),
+            "original_url": article.get('url', ''),
+            "feed_name": article.get('feed_name', 'Unknown'),
+            "quality_score": article.get('quality_score', 0),
+            "quality_level": article.get('quality_level', 'unknown'),
+            "category": category
+        }
+    
     def _summarize_article(self, article: Dict[str, Any], category: str) -> Dict[str, Any]:
         """Summarize a single article based on its category."""
         try:
             # Prepare article for summarization
             prepared_article = self._prepare_article_for_summarization(article, category)
+            if self._lacks_usable_content(prepared_article, category):
+                return self._finalize_summary(prepared_article, category, None, skipped=True)
             
-            # Create prompt and call LLM
-            prompt = self._create_summarization_prompt(prepared_article, category)
-            llm_response = self._call_llm(prompt)
+            # Reuse a summary from an earlier run, otherwise call the LLM
+            cache_key, llm_response = self._lookup_summary_cache(prepared_article, category)
+            if llm_response is None:
+                llm_response = self._call_llm(prepared_article, category)
+                if cache_key is not None and llm_response is not None:
+                    self._store_summary_cache(cache_key, llm_response)
             
-            if llm_response is not None:
-                # LLM succeeded
-                summary_result = llm_response
-                summary_result['fallback_used'] = False
-                self.logger.debug(f"✅ LLM summarization successful for: {prepared_article['title'][:50]}...")
-            else:
-                # LLM failed - use fallback
-                summary_result = self._create_fallback_summary(prepared_article, category)
-                self.logger.warning(f"⚠️ Using fallback summarization for: {prepared_article['title'][:50]}...")
-            
-            # Add metadata
-            summary_result['original_title'] = prepared_article['title']
-            summary_result['original_url'] = prepared_article['url']
-            summary_result['feed_name'] = prepared_article['feed_name']
-            summary_result['quality_score'] = prepared_article['quality_score']
-            summary_result['quality_level'] = prepared_article['quality_level']
-            summary_result['category'] = category
-            
-            return summary_result
+            return self._finalize_summary(prepared_article, category, llm_response)
             
         except Exception as e:
             self.logger.error(f"❌ Error summarizing article: {e}")
             # Return minimal fallback
-            return {
-                "title": self._clean_text(article.get('title', 'Untitled')),
-                "summary": "",
-                "word_count": 0,
-                "content_source_used": "none",
-                "fallback_used": True,
-                "error": str(e),
-                "original_title": article.get('title', 'Untitled'),
-                "original_url": article.get('url', ''),
-                "feed_name": article.get('feed_name', 'Unknown'),
-                "quality_score": article.get('quality_score', 0),
-                "quality_level": article.get('quality_level', 'unknown'),
-                "category": category
-            }
+            return self._create_error_summary(article, category, e)
+    
+    async def _summarize_article_async(self, article: Dict[str, Any], category: str,
+                                       session, sem: asyncio.Semaphore) -> Dict[str, Any]:
+        """Summarize a single article, bounded by the concurrency semaphore."""
+        async with sem:
+            try:
+                prepared_article = self._prepare_article_for_summarization(article, category)
+                if self._lacks_usable_content(prepared_article, category):
+                    return self._finalize_summary(prepared_article, category, None, skipped=True)
+                cache_key, llm_response = self._lookup_summary_cache(prepared_article, category)
+                if llm_response is None:
+                    llm_response = await self._call_llm_async(prepared_article, category, session)
+                    if cache_key is not None and llm_response is not None:
+                        self._store_summary_cache(cache_key, llm_response)
+                return self._finalize_summary(prepared_article, category, llm_response)
+            
+            except Exception as e:
+                self.logger.error(f"❌ Error summarizing article: {e}")
+                return self._create_error_summary(article, category, e)
+    
+    async def _execute_async(self, tasks: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Summarize (article, category) pairs concurrently.
+        
+        Returns:
+            Summaries in task order
+        """
+        sem = asyncio.Semaphore(self.max_concurrency)
+        
+        # One pooled session so connections to Ollama are reused across requests
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency, keepalive_timeout=60)
+        timeout = aiohttp.ClientTimeout(total=self.request_timeout, sock_connect=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            return await asyncio.gather(*(
+                self._summarize_article_async(article, category, session, sem) for article, category in tasks
+            ))
+    
+    def _execute_threaded(self, tasks: List[tuple]) -> List[Dict[str, Any]]:
+        """
+        Summarize (article, category) pairs on a bounded thread pool.
+        
+        Used for the synchronous clients (Together AI, or Ollama without aiohttp);
+        the shared requests session is pooled for max_concurrency connections.
+        
+        Returns:
+            Summaries in task order
+        """
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='summarize') as executor:
+            return list(executor.map(lambda task: self._summarize_article(*task), tasks))
     
     def execute(self) -> Dict[str, Any]:
         """Execute the summarization step."""
@@ -411,7 +717,8 @@ Focus on creating content that would be valuable for tech professionals and enth
                         'secondary_count': 0,
                         'optional_count': 0,
                         'llm_success_count': 0,
-                        'fallback_count': 0
+                        'fallback_count': 0,
+                        'skipped_no_content': 0
                     }
                 }
             
@@ -428,45 +735,36 @@ Focus on creating content that would be valuable for tech professionals and enth
                 'secondary_count': 0,
                 'optional_count': 0,
                 'llm_success_count': 0,
-                'fallback_count': 0
+                'fallback_count': 0,
+                'skipped_no_content': 0
             }
             
-            # Process headlines
+            # Summarize all categories concurrently; results keep task order
             headlines = categorization.get('headlines', [])
-            self.logger.info(f"📰 Summarizing {len(headlines)} headline articles...")
-            for article in headlines:
-                summary = self._summarize_article(article, 'headlines')
-                summaries['headlines'].append(summary)
-                statistics['headlines_count'] += 1
-                statistics['total_articles'] += 1
-                if summary.get('fallback_used', False):
-                    statistics['fallback_count'] += 1
-                else:
-                    statistics['llm_success_count'] += 1
-            
-            # Process secondary
             secondary = categorization.get('secondary', [])
-            self.logger.info(f"📋 Summarizing {len(secondary)} secondary articles...")
-            for article in secondary:
-                summary = self._summarize_article(article, 'secondary')
-                summaries['secondary'].append(summary)
-                statistics['secondary_count'] += 1
-                statistics['total_articles'] += 1
-                if summary.get('fallback_used', False):
-                    statistics['fallback_count'] += 1
-                else:
-                    statistics['llm_success_count'] += 1
-            
-            # Process optional
             optional = categorization.get('optional', [])
+            self.logger.info(f"📰 Summarizing {len(headlines)} headline articles...")
+            self.logger.info(f"📋 Summarizing {len(secondary)} secondary articles...")
             self.logger.info(f"📄 Summarizing {len(optional)} optional articles...")
-            for article in optional:
-                summary = self._summarize_article(article, 'optional')
-                summaries['optional'].append(summary)
-                statistics['optional_count'] += 1
+            
+            tasks = [(article, category) for category in _CATEGORIES for article in categorization.get(category, [])]
+            
+            if self.provider != 'together_ai' and AIOHTTP_AVAILABLE:
+                results = asyncio.run(self._execute_async(tasks))
+            else:
+                results = self._execute_threaded(tasks)
+            
+            if self.cache_enabled:
+                self._prune_summary_cache()
+            
+            for (_, category), summary in zip(tasks, results):
+                summaries[category].append(summary)
+                statistics[f'{category}_count'] += 1
                 statistics['total_articles'] += 1
                 if summary.get('fallback_used', False):
                     statistics['fallback_count'] += 1
+                    if summary.get('skipped_no_content', False):
+                        statistics['skipped_no_content'] += 1
                 else:
                     statistics['llm_success_count'] += 1
             
@@ -498,6 +796,7 @@ Focus on creating content that would be valuable for tech professionals and enth
             self.logger.info(f"   📄 Optional: {statistics['optional_count']}")
             self.logger.info(f"   ✅ LLM Success: {statistics['llm_success_count']}/{statistics['total_articles']}")
             self.logger.info(f"   🔄 Fallback Used: {statistics['fallback_count']}/{statistics['total_articles']}")
+            self.logger.info(f"   ⏭️ Skipped (no content): {statistics['skipped_no_content']}")
             
             # Show sample summaries
             if summaries['headlines']:
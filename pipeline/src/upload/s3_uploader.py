@@ -298,7 +298,7 @@ class S3Uploader:
                 processed_result = self.upload_directory(
                     str(processed_path),
                     f"{s3_prefix}/processed",
-                    include_patterns=['*.json', '*.csv', '*.txt']
+                    include_patterns=['*.json', '*.json.gz', '*.csv', '*.txt']
                 )
                 upload_results['processed'] = processed_result
             
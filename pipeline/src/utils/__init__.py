@@ -9,6 +9,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from utils.logger import get_logger, initialize_logger, reset_logger, PipelineLogger
 from utils.config_loader import ConfigLoader, load_pipeline_config
 from utils.together_client import TogetherAIClient, create_together_client
+from utils.json_utils import load_json, dump_json, loads_json, dumps_json, find_json_object
 
 __all__ = [
     'get_logger',
@@ -18,5 +19,10 @@ __all__ = [
     'ConfigLoader',
     'load_pipeline_config',
     'TogetherAIClient',
-    'create_together_client'
+    'create_together_client',
+    'load_json',
+    'dump_json',
+    'loads_json',
+    'dumps_json',
+    'find_json_object'
 ]
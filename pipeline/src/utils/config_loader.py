@@ -9,6 +9,15 @@ from typing import Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 
+# Pipeline root (the directory holding config/ and run_pipeline.py)
+PIPELINE_ROOT = Path(__file__).resolve().parent.parent.parent
+
+
+def resolve_pipeline_path(path: str) -> Path:
+    """Resolve a relative path against the pipeline root instead of the working directory."""
+    resolved = Path(path)
+    return resolved if resolved.is_absolute() else PIPELINE_ROOT / resolved
+
 
 class ConfigLoader:
     """Utility class for loading and managing pipeline configurations."""
@@ -0,0 +1,126 @@
+"""
+JSON file helpers for the Bit-by-Bit newsletter pipeline.
+
+Uses orjson when it is installed (faster, and serializes numpy types natively)
+and falls back to the standard library json module otherwise.
+"""
+
+import json
+import mmap
+import os
+from pathlib import Path
+from typing import Any, Optional, Union
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Files at least this large are parsed straight from a read-only mmap
+_MMAP_MIN_BYTES = 64 * 1024
+
+
+def _json_default(obj: Any) -> Any:
+    """Convert numpy scalars and arrays for the stdlib json fallback."""
+    if hasattr(obj, 'tolist'):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def loads_json(text: Union[str, bytes]) -> Any:
+    """Parse a JSON string; raises ValueError on invalid input."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def dumps_json(data: Any, indent: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes; compact (one line, suitable for JSONL) unless indent is set."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=_json_default, option=option)
+    return json.dumps(data, indent=2 if indent else None, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+
+def find_json_object(text: str) -> Optional[str]:
+    """
+    Locate the first balanced top-level JSON object in text with a single scan.
+
+    Braces inside double-quoted strings are ignored, including quoted text before
+    the object. If no balanced object is found (e.g. an unmatched quote in the
+    surrounding prose), falls back to the first-'{' to last-'}' slice.
+
+    Returns:
+        The object substring, or None if the text has no '{' ... '}' span
+    """
+    depth = 0
+    start = -1
+    in_string = False
+    escaped = False
+
+    for i, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            if depth == 0:
+                start = i
+            depth += 1
+        elif char == '}' and depth:
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    start = text.find('{')
+    end = text.rfind('}')
+    return text[start:end + 1] if start != -1 and end > start else None
+
+
+def load_json(path: Union[str, Path], use_mmap: bool = False) -> Any:
+    """
+    Load a JSON file.
+
+    Args:
+        path: JSON file path
+        use_mmap: Parse large files (>= 64 KiB) directly from a memory map
+                  instead of reading them into a bytes copy (orjson only)
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            if use_mmap and os.fstat(f.fileno()).st_size >= max(_MMAP_MIN_BYTES, mmap.PAGESIZE):
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+            return orjson.loads(f.read())
+
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(data: Any, path: Union[str, Path], indent: bool = True) -> None:
+    """
+    Write data to a JSON file as UTF-8.
+
+    Args:
+        data: JSON-serializable data (numpy scalars and arrays are supported)
+        path: Destination file path
+        indent: Pretty-print with 2-space indentation
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=_json_default, option=option))
+        return
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2 if indent else None, ensure_ascii=False, default=_json_default)
@@ -67,6 +67,10 @@ class PipelineLogger:
         """Log debug message."""
         self.logger.debug(message, extra=kwargs)
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Whether messages at this level would be emitted (lets callers skip building them)."""
+        return self.logger.isEnabledFor(level)
+    
     def critical(self, message: str, exception: Optional[Exception] = None, **kwargs) -> None:
         """Log critical message that might break the pipeline."""
         if exception:
@@ -44,13 +44,16 @@ class TogetherAIClient:
         self.retry_delay = retry_delay
         self.logger = get_logger()
     
-    def generate_completion(self, prompt: str, system_message: Optional[str] = None) -> str:
+    def generate_completion(self, prompt: str, system_message: Optional[str] = None,
+                            model: Optional[str] = None, max_tokens: Optional[int] = None) -> str:
         """
         Generate a completion using Together AI.
         
         Args:
             prompt: The user prompt
             system_message: Optional system message for context
+            model: Optional model override for this request
+            max_tokens: Optional output token limit override for this request
             
         Returns:
             Generated text response
@@ -70,10 +73,10 @@ class TogetherAIClient:
                 self.logger.debug(f"Making Together AI request (attempt {attempt + 1}/{self.max_retries})")
                 
                 response = self.client.chat.completions.create(
-                    model=self.model,
+                    model=model or self.model,
                     messages=messages,
                     temperature=self.temperature,
-                    max_tokens=self.max_tokens
+                    max_tokens=max_tokens or self.max_tokens
                 )
                 
                 if response.choices and len(response.choices) > 0:
@@ -95,13 +98,16 @@ class TogetherAIClient:
                 else:
                     raise Exception(f"Together AI request failed after {self.max_retries} attempts: {e}")
     
-    def generate_json_completion(self, prompt: str, system_message: Optional[str] = None) -> Dict[str, Any]:
+    def generate_json_completion(self, prompt: str, system_message: Optional[str] = None,
+                                 model: Optional[str] = None, max_tokens: Optional[int] = None) -> Dict[str, Any]:
         """
         Generate a JSON completion using Together AI.
         
         Args:
             prompt: The user prompt (should request JSON response)
             system_message: Optional system message for context
+            model: Optional model override for this request
+            max_tokens: Optional output token limit override for this request
             
         Returns:
             Parsed JSON response as dictionary
@@ -109,7 +115,7 @@ class TogetherAIClient:
         Raises:
             Exception: If JSON parsing fails or all retry attempts fail
         """
-        response_text = self.generate_completion(prompt, system_message)
+        response_text = self.generate_completion(prompt, system_message, model=model, max_tokens=max_tokens)
         
         try:
             # First try to parse the entire response as JSON
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Tests for the Deduplication Step's SimHash prefilter and similarity grouping.
+"""
+
+import unittest
+import logging
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processing.deduplication import DeduplicationStep, SENTENCE_TRANSFORMERS_AVAILABLE
+
+if SENTENCE_TRANSFORMERS_AVAILABLE:
+    import numpy as np
+
+
+def make_step(**overrides):
+    """Build a step without reading pipeline configs or loading a model."""
+    step = DeduplicationStep.__new__(DeduplicationStep)
+    step.logger = logging.getLogger('test_deduplication')
+    step.similarity_threshold = 0.8
+    step.similarity_block_size = 2
+    step.ann_min_articles = 10 ** 9
+    step.simhash_max_distance = 3
+    step.quality_priority = True
+    for name, value in overrides.items():
+        setattr(step, name, value)
+    return step
+
+
+@unittest.skipUnless(SENTENCE_TRANSFORMERS_AVAILABLE, "embedding dependencies not installed")
+class TestSimHash(unittest.TestCase):
+    def setUp(self):
+        self.step = make_step()
+
+    def test_identical_texts_share_fingerprint(self):
+        text = "OpenAI releases a new model for code generation today"
+        self.assertEqual(self.step._simhash(text), self.step._simhash(text.upper()))
+        self.assertEqual(self.step._simhash(""), 0)
+
+    def test_near_exact_duplicates_map_to_lowest_index(self):
+        base = " ".join(f"word{i}" for i in range(200))
+        texts = [
+            "A completely different story about databases and storage engines",
+            base,
+            base + " extra",
+            base.replace("word199", "final"),
+        ]
+
+        representatives = self.step._find_near_exact_duplicates(texts)
+
+        self.assertEqual(representatives[0], 0)
+        self.assertEqual(representatives.tolist()[1:], [1, 1, 1])
+
+    def test_distinct_texts_are_their_own_representatives(self):
+        texts = [f"story number {i} about topic {i * 7} and more {i * 13}" for i in range(5)]
+        self.assertEqual(self.step._find_near_exact_duplicates(texts).tolist(), list(range(5)))
+
+
+@unittest.skipUnless(SENTENCE_TRANSFORMERS_AVAILABLE, "embedding dependencies not installed")
+class TestSimilarityGrouping(unittest.TestCase):
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        base = rng.normal(size=(3, 16))
+        # Articles 0/3/5 and 1/4 are near-copies; 2 stands alone
+        vectors = base[[0, 1, 2, 0, 1, 0]] + rng.normal(scale=0.01, size=(6, 16))
+        self.embeddings = (vectors / np.linalg.norm(vectors, axis=1, keepdims=True)).astype(np.float32)
+
+    def test_blocked_edges_match_full_matrix(self):
+        full = self.embeddings @ self.embeddings.T
+        expected = {(i, j) for i in range(6) for j in range(i + 1, 6) if full[i, j] > 0.8}
+
+        for block_size in (1, 2, 4, 64):
+            rows, cols, sims = make_step(similarity_block_size=block_size)._find_similarity_edges(self.embeddings)
+            self.assertEqual(set(zip(rows.tolist(), cols.tolist())), expected)
+            np.testing.assert_allclose(sims, full[rows, cols], rtol=1e-5)
+
+    def test_groups_follow_connected_components(self):
+        articles = [{'quality_score': score} for score in (5, 6, 9, 8, 2, 1)]
+
+        groups = make_step()._find_similar_articles(self.embeddings, articles)
+
+        self.assertEqual([g['main_article_index'] for g in groups], [0, 1, 2])
+        self.assertEqual([g['similar_indices'] for g in groups], [[3, 5], [4], []])
+        self.assertEqual([g['best_article_index'] for g in groups], [3, 1, 2])
+        self.assertEqual(groups[0]['competing_indices'], [0, 5])
+        self.assertEqual(groups[2]['max_similarity'], 0.0)
+        self.assertGreater(groups[0]['max_similarity'], 0.8)
+        self.assertNotIn('similarity_score', articles[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Tests for the JSON helpers in src/utils/json_utils.py.
+"""
+
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.json_utils import find_json_object
+
+
+class TestFindJsonObject(unittest.TestCase):
+    def test_plain_object(self):
+        self.assertEqual(find_json_object('Result: {"a": 1} done'), '{"a": 1}')
+
+    def test_nested_object_and_braces_in_strings(self):
+        text = 'x {"a": {"b": "}{"}, "c": "\\"{"} y'
+        self.assertEqual(find_json_object(text), '{"a": {"b": "}{"}, "c": "\\"{"}')
+
+    def test_quoted_brace_before_object(self):
+        self.assertEqual(find_json_object('"{" {"a":1}'), '{"a":1}')
+
+    def test_unbalanced_quote_before_object_falls_back(self):
+        self.assertEqual(find_json_object('He said "hi {"a":1}'), '{"a":1}')
+
+    def test_no_object(self):
+        self.assertIsNone(find_json_object('no json here'))
+        self.assertIsNone(find_json_object('{ unclosed'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Tests for the LLM Quality Scoring Step's checkpoint and response-parsing helpers.
+"""
+
+import unittest
+import logging
+import tempfile
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processing.llm_quality_scoring import LLMQualityScoringStep, _SCORE_FIELDS
+from src.utils.json_utils import dumps_json
+
+
+def make_step(processed_dir=None):
+    """Build a step without reading pipeline configs."""
+    step = LLMQualityScoringStep.__new__(LLMQualityScoringStep)
+    step.logger = logging.getLogger('test_llm_quality_scoring')
+    step.config = {'output': {'filename_prefix': 'llm_quality_scoring'}}
+    step.data_paths = {'processed': str(processed_dir)}
+    step._validator = None
+    return step
+
+
+def new_stream_state():
+    return {'depth': 0, 'opened': False, 'in_string': False, 'escaped': False}
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.step = make_step(self.tmp_dir.name)
+        self.articles = [{'title': 'First'}, {'title': 'Second'}, {'title': 'Third'}]
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def write_checkpoint(self, records, trailer=b''):
+        with open(self.step._get_checkpoint_path(), 'wb') as f:
+            for record in records:
+                f.write(dumps_json(record) + b'\n')
+            f.write(trailer)
+
+    def test_missing_checkpoint(self):
+        self.assertEqual(self.step._load_checkpoint(self.articles), {})
+
+    def test_resume_matching_records(self):
+        self.write_checkpoint([
+            {'i': 0, 'title': 'First', 'analysis': {'overall_quality': 7}, 'attempt': 2},
+            {'i': 2, 'title': 'Third', 'analysis': {'overall_quality': 4}, 'attempt': 1},
+        ], trailer=b'{"i": 1, "title": "Sec')  # torn last line from a crash
+
+        resumed = self.step._load_checkpoint(self.articles)
+
+        self.assertEqual(sorted(resumed), [0, 2])
+        self.assertEqual(resumed[0], {'success': True, 'analysis': {'overall_quality': 7}, 'attempt': 2})
+        self.assertEqual(resumed[2]['analysis'], {'overall_quality': 4})
+
+    def test_skips_title_mismatch_and_out_of_range(self):
+        self.write_checkpoint([
+            {'i': 1, 'title': 'Renamed', 'analysis': {'overall_quality': 9}},
+            {'i': 5, 'title': 'First', 'analysis': {'overall_quality': 9}},
+        ])
+
+        self.assertEqual(self.step._load_checkpoint(self.articles), {})
+
+
+class TestStreamParsing(unittest.TestCase):
+    def setUp(self):
+        self.step = make_step()
+
+    def feed(self, fragments, done_last=False):
+        parts, state, finished = [], new_stream_state(), []
+        for n, fragment in enumerate(fragments):
+            line = dumps_json({'response': fragment, 'done': done_last and n == len(fragments) - 1})
+            finished.append(self.step._accumulate_stream_chunk(line, parts, state))
+        return ''.join(parts), finished
+
+    def test_stops_when_object_closes(self):
+        text, finished = self.feed(['Here: {"a": ', '{"b": 1}', ', "c": 2', '}'])
+        self.assertEqual(finished, [False, False, False, True])
+        self.assertEqual(text, 'Here: {"a": {"b": 1}, "c": 2}')
+
+    def test_ignores_braces_in_strings(self):
+        _, finished = self.feed(['{"reason": "uses } and {', ' braces\\" }"', '}'])
+        self.assertEqual(finished, [False, False, True])
+
+    def test_ignores_quotes_before_object(self):
+        _, finished = self.feed(['A "quoted" intro ', '{"a": 1}'])
+        self.assertEqual(finished, [False, True])
+
+    def test_done_flag_ends_stream(self):
+        _, finished = self.feed(['{"a": 1'], done_last=True)
+        self.assertEqual(finished, [True])
+
+    def test_blank_line_is_ignored(self):
+        parts = []
+        self.assertFalse(self.step._accumulate_stream_chunk(b'\n', parts, new_stream_state()))
+        self.assertEqual(parts, [])
+
+    def test_parse_restores_brace_swallowed_by_stop(self):
+        body = ', '.join(f'"{field}": 5' for field in _SCORE_FIELDS)
+        analysis = self.step._parse_analysis_response('Analysis: {' + body + '\n')
+        self.assertEqual(analysis, {field: 5 for field in _SCORE_FIELDS})
+
+    def test_parse_rejects_missing_fields(self):
+        with self.assertRaises(ValueError):
+            self.step._parse_analysis_response('{"overall_quality": 5}')
+
+    def test_parse_rejects_no_json(self):
+        with self.assertRaises(ValueError):
+            self.step._parse_analysis_response('no analysis here')
+
+
+if __name__ == '__main__':
+    unittest.main()
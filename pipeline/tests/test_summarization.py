@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Tests for the Summarization Step's summary cache and content truncation.
+"""
+
+import unittest
+import logging
+import os
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.processing.summarization import SummarizationStep, TIKTOKEN_AVAILABLE
+
+if TIKTOKEN_AVAILABLE:
+    import tiktoken
+
+
+def make_step(cache_dir=None, encoding=None):
+    """Build a step without reading pipeline configs or opening an LLM client."""
+    step = SummarizationStep.__new__(SummarizationStep)
+    step.logger = logging.getLogger('test_summarization')
+    step.provider = 'ollama'
+    step.model_name = 'llama3.2:3b'
+    step.category_models = {}
+    step.category_max_tokens = {'headlines': 120}
+    step.num_predict = 200
+    step.cache_enabled = True
+    step.cache_dir = Path(cache_dir) if cache_dir else None
+    step.cache_max_age_days = 30
+    step._encoding = encoding
+    step._truncate_cached = lru_cache(maxsize=16)(step._truncate_uncached)
+    return step
+
+
+ARTICLE = {'title': 'New chip announced', 'content': 'Details about the chip.', 'content_source': 'full_content'}
+
+
+class TestSummaryCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.step = make_step(self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_store_then_lookup(self):
+        key, cached = self.step._lookup_summary_cache(ARTICLE, 'headlines')
+        self.assertIsNone(cached)
+
+        response = {'success': True, 'title': 'Chip', 'summary': 'A new chip.'}
+        self.step._store_summary_cache(key, response)
+
+        self.assertEqual(self.step._lookup_summary_cache(ARTICLE, 'headlines'), (key, response))
+        self.assertEqual(list(self.step._get_summary_cache_path(key).parent.glob('*.tmp')), [])
+
+    def test_key_depends_on_prompt_and_output_limit(self):
+        key = self.step._get_summary_cache_key(ARTICLE, 'headlines')
+        self.assertNotEqual(key, self.step._get_summary_cache_key(dict(ARTICLE, title='Other'), 'headlines'))
+        self.assertNotEqual(key, self.step._get_summary_cache_key(ARTICLE, 'secondary'))
+        self.step.category_max_tokens = {'headlines': 80}
+        self.assertNotEqual(key, self.step._get_summary_cache_key(ARTICLE, 'headlines'))
+
+    def test_disabled_cache_skips_lookup(self):
+        self.step.cache_enabled = False
+        self.assertEqual(self.step._lookup_summary_cache(ARTICLE, 'headlines'), (None, None))
+
+    def test_prune_removes_only_stale_entries(self):
+        fresh_key = self.step._get_summary_cache_key(ARTICLE, 'headlines')
+        stale_key = self.step._get_summary_cache_key(ARTICLE, 'secondary')
+        self.step._store_summary_cache(fresh_key, {'summary': 'fresh'})
+        self.step._store_summary_cache(stale_key, {'summary': 'stale'})
+        old = time.time() - 31 * 86400
+        os.utime(self.step._get_summary_cache_path(stale_key), (old, old))
+
+        self.step._prune_summary_cache()
+
+        self.assertTrue(self.step._get_summary_cache_path(fresh_key).exists())
+        self.assertFalse(self.step._get_summary_cache_path(stale_key).exists())
+
+    def test_lookup_refreshes_entry_age(self):
+        key = self.step._get_summary_cache_key(ARTICLE, 'headlines')
+        self.step._store_summary_cache(key, {'summary': 'kept'})
+        old = time.time() - 31 * 86400
+        os.utime(self.step._get_summary_cache_path(key), (old, old))
+
+        self.step._lookup_summary_cache(ARTICLE, 'headlines')
+        self.step._prune_summary_cache()
+
+        self.assertTrue(self.step._get_summary_cache_path(key).exists())
+
+
+class TestTruncation(unittest.TestCase):
+    def test_character_estimate_without_tokenizer(self):
+        step = make_step()
+        self.assertEqual(step._truncate_uncached('short text', 10), 'short text')
+
+        truncated = step._truncate_uncached('word ' * 100, 10)
+        self.assertTrue(truncated.endswith('...'))
+        self.assertLessEqual(len(truncated), 40 + 3)
+        self.assertFalse(truncated[:-3].endswith(' '))
+
+    @unittest.skipUnless(TIKTOKEN_AVAILABLE, "tiktoken not installed")
+    def test_token_limit_with_tokenizer(self):
+        try:
+            encoding = tiktoken.get_encoding('cl100k_base')
+        except Exception as e:
+            self.skipTest(f"cl100k_base unavailable: {e}")
+        step = make_step(encoding=encoding)
+        content = 'tokens ' * 500
+
+        self.assertEqual(step._truncate_uncached(content, 1000), content)
+        truncated = step._truncate_uncached(content, 50)
+        self.assertTrue(truncated.endswith('...'))
+        self.assertLessEqual(len(encoding.encode(truncated[:-3])), 50)
+
+    def test_truncate_content_handles_empty(self):
+        self.assertEqual(make_step()._truncate_content('', 10), '')
+
+
+if __name__ == '__main__':
+    unittest.main()